@@ -0,0 +1,158 @@
+"""メモの読み込みベンチマーク
+
+1 MB / 10 MB / 50 MB のメモを生成し、次の 2 通りで読み込んだときの
+時間と、その間に Tk のイベントループがどれだけ止まったかを測る。
+chunked では ChunkedLoader 自身が数えた最初の 1 回・最長の 1 回の処理時間も出す。
+
+- blocking: 全文を 1 回の insert で入れてから全行を装飾する（従来の方式）
+- chunked : ChunkedLoader で少しずつ入れ、画面に見えている行だけ装飾する
+
+使い方（リポジトリのルートで、ディスプレイのある環境で実行）::
+
+    python -m benchmarks.bench_memo_load
+    python -m benchmarks.bench_memo_load --sizes 1 10
+    python -m benchmarks.bench_memo_load --output benchmarks/bench_memo_load_results.md
+
+--output を付けると、結果を Markdown の表にしてそのファイルに書く。
+"""
+
+import argparse
+import random
+import tempfile
+import time
+import tkinter as tk
+from pathlib import Path
+
+from windows.utils.memo_decorator import MemoDecorator
+from windows.utils.memo_loader import ChunkedLoader, iter_file_chunks
+from windows.utils.text_edits import TextEditTracker
+
+SAMPLE_LINES = [
+    "今日のやること",
+    "[ ] 牛乳を買う",
+    "[x] 洗濯物を取り込む",
+    "参考: https://example.com/articles/12345",
+    "The quick brown fox jumps over the lazy dog.",
+    "",
+]
+TICK_MS = 10
+
+
+def make_memo(path: Path, size_mb: int) -> None:
+    rng = random.Random(size_mb)
+    target = size_mb * 1024 * 1024
+    with open(path, "w", encoding="utf-8") as f:
+        written = 0
+        while written < target:
+            line = rng.choice(SAMPLE_LINES) + "\n"
+            f.write(line)
+            written += len(line.encode("utf-8"))
+
+
+def make_text(root: tk.Tk) -> tk.Text:
+    text = tk.Text(root, wrap=tk.WORD, width=30, height=12)
+    text.pack(expand=True, fill=tk.BOTH)
+    text.tag_configure("link", foreground="blue", underline=True)
+    text.tag_configure("checked", foreground="gray", overstrike=True)
+    root.update()
+    return text
+
+
+def watch_stalls(root: tk.Tk, stalls: list) -> None:
+    """TICK_MS ごとのタイマーが実際にどれだけ遅れたかを記録し続ける"""
+    last = time.perf_counter()
+
+    def tick():
+        nonlocal last
+        now = time.perf_counter()
+        stalls.append(now - last - TICK_MS / 1000)
+        last = now
+        root.after(TICK_MS, tick)
+
+    root.after(TICK_MS, tick)
+
+
+def bench_blocking(path: Path) -> dict:
+    root = tk.Tk()
+    text = make_text(root)
+    decorator = MemoDecorator(text, TextEditTracker(text))
+    started = time.perf_counter()
+    text.insert("1.0", path.read_text(encoding="utf-8"))
+    decorator.decorate_all()
+    root.update()
+    elapsed = time.perf_counter() - started
+    root.destroy()
+    return {"first": elapsed, "total": elapsed, "max_stall": elapsed, "first_slice": elapsed, "max_slice": elapsed}
+
+
+def bench_chunked(path: Path) -> dict:
+    root = tk.Tk()
+    text = make_text(root)
+    decorator = MemoDecorator(text, TextEditTracker(text))
+    stalls: list = []
+    result: dict = {}
+
+    def insert(chunk: str) -> None:
+        first_line = int(text.index("end-1c").split(".")[0])
+        with decorator.ignoring_edits():
+            text.insert("end", chunk)
+        decorator.defer_lines(first_line, int(text.index("end-1c").split(".")[0]))
+        top = int(text.index("@0,0").split(".")[0])
+        bottom = int(text.index(f"@0,{text.winfo_height()}").split(".")[0])
+        decorator.decorate_range(top, bottom)
+
+    def done() -> None:
+        result["total"] = time.perf_counter() - started
+        root.quit()
+
+    loader = ChunkedLoader(text, iter_file_chunks(path), insert, done)
+    started = time.perf_counter()
+    loader.start()
+    root.update_idletasks()
+    result["first"] = time.perf_counter() - started
+    watch_stalls(root, stalls)
+    if not loader.done:
+        root.mainloop()
+    root.destroy()
+    result["max_stall"] = max(stalls, default=0.0)
+    result["slices"] = loader.stats.slices
+    result["first_slice"] = loader.stats.first_slice_sec
+    result["max_slice"] = loader.stats.max_slice_sec
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 50], help="memo sizes in MB")
+    parser.add_argument("--output", type=Path, help="write the results as a Markdown table to this file")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            path = Path(tmp) / f"memo_{size}mb.txt"
+            make_memo(path, size)
+            for name, bench in (("blocking", bench_blocking), ("chunked", bench_chunked)):
+                r = bench(path)
+                rows.append((size, name, r))
+                print(
+                    f"{size:>3} MB {name:<8} first screen {r['first'] * 1000:8.1f} ms  "
+                    f"total {r['total'] * 1000:9.1f} ms  max UI stall {r['max_stall'] * 1000:8.1f} ms  "
+                    f"first slice {r['first_slice'] * 1000:7.1f} ms  max slice {r['max_slice'] * 1000:7.1f} ms"
+                )
+
+    if args.output:
+        lines = [
+            "| size | mode | first screen [ms] | total [ms] | max UI stall [ms] | first slice [ms] | max slice [ms] |",
+            "| ---: | :--- | ---: | ---: | ---: | ---: | ---: |",
+        ]
+        for size, name, r in rows:
+            lines.append(
+                f"| {size} MB | {name} | {r['first'] * 1000:.1f} | {r['total'] * 1000:.1f} | "
+                f"{r['max_stall'] * 1000:.1f} | {r['first_slice'] * 1000:.1f} | {r['max_slice'] * 1000:.1f} |"
+            )
+        args.output.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
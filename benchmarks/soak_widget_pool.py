@@ -0,0 +1,86 @@
+"""吹き出しウィンドウのウィジェット数が増え続けないことを確かめるソークテスト
+
+BubbleWindow を実際に作り、投稿表示（画像あり・なし、いいね済み・未）と
+メニュー → SNS 設定 → ログインフォームの画面切り替えを何周も繰り返す。
+周回ごとに Tk のウィジェット数（winfo_children をたどった数）と
+WidgetPool が作ったウィジェット数を記録し、最初の数周のあとで
+どちらも増えていないことを assert する。
+
+通信は行わない（data/credentials.json がなければログインもしない）。
+使い方（リポジトリのルートで、ディスプレイのある Windows 環境で実行）::
+
+    python -m benchmarks.soak_widget_pool
+    python -m benchmarks.soak_widget_pool --cycles 2000
+"""
+
+import argparse
+import time
+import tkinter as tk
+
+from PIL import Image
+
+from windows.bubble_window import BubbleWindow
+from windows.utils.post import PostRender
+from windows.utils.widget_pool import count_widgets
+
+WARMUP_CYCLES = 5  # 全種類のウィジェットが一通り作られるまで
+
+
+def make_render(i: int) -> PostRender:
+    image = Image.new("RGB", (120, 80), (i % 256, 128, 200)) if i % 2 else None
+    return PostRender(
+        uri=f"at://soak/{i}",
+        cid=f"cid{i}",
+        text=f"ソークテストの投稿 {i}\n" + "長めの本文で折り返しも起こす。" * (i % 4),
+        image_url="https://example.com/image.png" if image else None,
+        image=image,
+        liked=i % 3 == 0,
+    )
+
+
+def run_cycle(bubble: BubbleWindow, i: int) -> None:
+    bubble._reset_like_button_state()
+    bubble._clear_post_content()
+    bubble._display_post_content(make_render(i))
+    bubble.typewriter.skip()
+    bubble.menu_mode()
+    bubble.handle_sns_settings()
+    bubble.display_login_form()
+    bubble.display_connecting()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=500, help="number of post/menu redraw cycles")
+    args = parser.parse_args()
+
+    root = tk.Tk()
+    root.withdraw()
+    bubble = BubbleWindow(root, 0, 0)
+    toplevel = bubble.canvas.winfo_toplevel()
+
+    counts = []
+    started = time.perf_counter()
+    for i in range(args.cycles):
+        run_cycle(bubble, i)
+        root.update()
+        counts.append((count_widgets(toplevel), bubble.widget_pool.created))
+        if i % 100 == 0:
+            print(f"cycle {i:>5}: tk_widgets={counts[-1][0]} pool_created={counts[-1][1]}")
+    elapsed = time.perf_counter() - started
+
+    settled_widgets, settled_created = counts[WARMUP_CYCLES - 1]
+    peak_widgets = max(widgets for widgets, _ in counts[WARMUP_CYCLES - 1 :])
+    peak_created = max(created for _, created in counts[WARMUP_CYCLES - 1 :])
+    print(f"{args.cycles} cycles in {elapsed:.1f}s: {bubble.widget_pool.report()}")
+    assert peak_widgets == settled_widgets, f"Tk widget count grew from {settled_widgets} to {peak_widgets}"
+    assert peak_created == settled_created, f"pool created widgets grew from {settled_created} to {peak_created}"
+    print("widget count stayed flat")
+
+    bubble.sns_runner.stop()
+    bubble.dispatcher.stop()
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
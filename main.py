@@ -1,23 +1,35 @@
+# 起動時刻の基準・import 計測の開始点になるので最初に import する
+from windows.utils.startup import IMPORT_TIMER, StartupTimer
 from tkinter import Tk
 from windows.character_window import CharacterWindow
 from windows.bubble_window import BubbleWindow
 from windows.memo_window import MemoWindow
 from windows.hand_window import HandWindow
+from windows.utils.asset_loader import AssetLoader
 
 
 class DesktopMascotApp:
-    def __init__(self, root):
+    def __init__(self, root, startup_timer: StartupTimer | None = None):
         self.root = root
+        self.startup_timer = startup_timer or StartupTimer()
+        self.startup_timer.mark("imports done")
+
+        # 画像の読み込み・加工はスレッドプールで行い、ウィンドウは先に表示する
+        self.asset_loader = AssetLoader(root)
+
         self.memo_window = MemoWindow(root, x_pos=425, y_pos=400)
         self.bubble_window = BubbleWindow(root, x_pos=135, y_pos=250)
         char_window_x = 450
         char_window_y = 175
-        self.hand_window = HandWindow(root, x_pos=char_window_x, y_pos=char_window_y)
+        self.hand_window = HandWindow(
+            root, x_pos=char_window_x, y_pos=char_window_y, asset_loader=self.asset_loader
+        )
         self.char_window = CharacterWindow(
             root,
             syncronized_windows=[self.memo_window, self.bubble_window, self.hand_window],
             x_pos=char_window_x,
             y_pos=char_window_y,
+            asset_loader=self.asset_loader,
         )
         self.memo_window.add_syncronized_window([self.hand_window, self.char_window])
         self.hand_window.add_syncronized_window([self.memo_window, self.char_window, self.bubble_window])
@@ -26,6 +38,32 @@ class DesktopMascotApp:
         self.memo_window.add_observer([self.char_window, self.bubble_window, self.hand_window])
         self.bubble_window.add_observer([self.char_window, self.memo_window, self.hand_window])
         self.hand_window.add_observer([self.char_window, self.memo_window, self.bubble_window])
+        self.startup_timer.mark("windows created")
+
+        # アイドル時に実行 = 最初の描画が終わった後
+        self.root.after_idle(self._on_first_paint)
+        self.asset_loader.when_idle(self._on_assets_ready)
+
+    def _on_first_paint(self):
+        self.startup_timer.mark("first paint")
+        self._print_startup_report()
+
+    def _on_assets_ready(self):
+        self.startup_timer.mark("sprites ready")
+        self.asset_loader.shutdown()
+        self._print_startup_report()
+
+    def _print_startup_report(self):
+        """最初の描画とスプライトの差し込みが両方終わったらレポートを出す
+
+        計測用の出力なので、DESKTOP_MASCOT_IMPORTTIME が設定されているときだけ。
+        """
+        if IMPORT_TIMER is None:
+            return
+        if None in (self.startup_timer.elapsed("first paint"), self.startup_timer.elapsed("sprites ready")):
+            return
+        print(self.startup_timer.report())
+        print(IMPORT_TIMER.report())
 
 
 if __name__ == "__main__":
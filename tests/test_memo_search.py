@@ -0,0 +1,154 @@
+"""MemoSearchIndex を Tk なしで確かめるテスト
+
+Text の代わりに文字列を持つだけの FakeText を使い、ランダムな挿入・削除と
+アイドル処理の途中での検索を繰り返して、結果が全文の総当たりと一致することを見る。
+行 ID の差し込み・削除と、索引作りの途中でのカーソルのずらし方をここで押さえる。
+"""
+
+import random
+import re
+from typing import Callable, Dict, List, Tuple
+
+from windows.utils.memo_search import MemoSearchIndex
+from windows.utils.text_edits import Position, TextEdit, end_of
+
+
+class FakeTracker:
+    def __init__(self) -> None:
+        self.listeners: List[Callable[[TextEdit], None]] = []
+
+    def add_listener(self, listener: Callable[[TextEdit], None]) -> None:
+        self.listeners.append(listener)
+
+
+class FakeText:
+    """MemoSearchIndex が使う分だけの tk.Text（"行.列" / "行.end" / "end - 1 chars"）"""
+
+    def __init__(self, content: str, tracker: FakeTracker) -> None:
+        self.content = content
+        self.tracker = tracker
+        self.callbacks: Dict[int, Callable[[], None]] = {}
+        self._next_id = 0
+        self.get_calls = 0
+
+    def lines(self) -> List[str]:
+        return self.content.split("\n")
+
+    def _offset(self, pos: Position) -> int:
+        return sum(len(line) + 1 for line in self.lines()[: pos[0] - 1]) + pos[1]
+
+    def _pos(self, index: str) -> Position:
+        if index == "end - 1 chars":
+            lines = self.lines()
+            return len(lines), len(lines[-1])
+        line, col = index.split(".")
+        return int(line), len(self.lines()[int(line) - 1]) if col == "end" else int(col)
+
+    def index(self, index: str) -> str:
+        return "%d.%d" % self._pos(index)
+
+    def get(self, start: str, end: str) -> str:
+        self.get_calls += 1
+        return self.content[self._offset(self._pos(start)) : self._offset(self._pos(end))]
+
+    def after(self, _ms: int, callback: Callable[[], None]) -> int:
+        self._next_id += 1
+        self.callbacks[self._next_id] = callback
+        return self._next_id
+
+    def after_idle(self, callback: Callable[[], None]) -> int:
+        return self.after(0, callback)
+
+    def after_cancel(self, after_id: int) -> None:
+        self.callbacks.pop(after_id, None)
+
+    def run_callbacks(self, count: int) -> None:
+        for _ in range(count):
+            if not self.callbacks:
+                return
+            self.callbacks.pop(min(self.callbacks))()
+
+    def insert(self, pos: Position, text: str) -> None:
+        offset = self._offset(pos)
+        self.content = self.content[:offset] + text + self.content[offset:]
+        self._notify(TextEdit("insert", pos, end_of(pos, text), text))
+
+    def delete(self, start: Position, end: Position) -> None:
+        first, last = self._offset(start), self._offset(end)
+        removed = self.content[first:last]
+        self.content = self.content[:first] + self.content[last:]
+        if removed:
+            self._notify(TextEdit("delete", start, end, removed))
+
+    def _notify(self, edit: TextEdit) -> None:
+        for listener in self.tracker.listeners:
+            listener(edit)
+
+
+def brute_force(content: str, query: str) -> List[Tuple[int, int, int]]:
+    pattern = re.compile(re.escape(query.strip()), re.IGNORECASE)
+    hits = []
+    for line, text in enumerate(content.split("\n"), start=1):
+        hits.extend((line, m.start(), m.end()) for m in pattern.finditer(text))
+    return hits
+
+
+PIECES = ["今日", "やること", "牛乳を買う", "fox", "Fox", "foobar", "https://x.y", "[x]", "\n", "\n", "  ", "日本語"]
+QUERIES = ["fox", "fo", "oo", "OBA", "x.y", "今日", "牛", "やる", "://", "日本語", "乳を買", "[x]"]
+
+
+def make_index(rng: random.Random) -> Tuple[FakeText, MemoSearchIndex]:
+    tracker = FakeTracker()
+    text = FakeText("".join(rng.choice(PIECES) for _ in range(50)), tracker)
+    # 1 回のアイドル処理で 3 行ずつしか進めず、索引作りの途中の状態を多く作る
+    index = MemoSearchIndex(text, tracker, build_batch_lines=3, slice_budget_ms=0.0001)
+    index.start_build()
+    return text, index
+
+
+def random_edit(rng: random.Random, text: FakeText) -> None:
+    lines = text.lines()
+    line = rng.randint(1, len(lines))
+    col = rng.randint(0, len(lines[line - 1]))
+    if rng.random() < 0.5:
+        text.insert((line, col), rng.choice(PIECES) + rng.choice(["", "\n"]))
+    else:
+        end_line = rng.randint(line, min(len(lines), line + 2))
+        end_col = rng.randint(col if end_line == line else 0, len(lines[end_line - 1]))
+        text.delete((line, col), (end_line, end_col))
+
+
+def test_search_matches_brute_force_while_editing_and_building():
+    rng = random.Random(1)
+    for _ in range(200):
+        text, index = make_index(rng)
+        for _ in range(60):
+            random_edit(rng, text)
+            if rng.random() < 0.3:
+                text.run_callbacks(rng.randint(1, 3))
+            if rng.random() < 0.2:
+                for query in QUERIES:
+                    assert index.search(query) == brute_force(text.content, query), query
+
+
+def test_search_reads_candidate_lines_from_the_index():
+    rng = random.Random(2)
+    text, index = make_index(rng)
+    text.run_callbacks(1000)
+    assert index.build_cursor is None
+
+    text.get_calls = 0
+    assert index.search("fox") == brute_force(text.content, "fox")
+    assert text.get_calls == 0
+
+
+def test_generation_changes_only_with_the_content():
+    rng = random.Random(3)
+    text, index = make_index(rng)
+    text.run_callbacks(1000)
+
+    generation = index.generation
+    index.search("fox")
+    assert index.generation == generation
+    text.insert((1, 0), "fox")
+    assert index.generation != generation
@@ -1,15 +1,17 @@
 from .base_window import WindowBase
 import tkinter as tk
 from tkinter import font as tkfont
-from atproto import Client
-from atproto_client.exceptions import ModelError
-from PIL import Image, ImageTk
-from .utils.password import generate_key, save_credentials, load_credentials
-from .utils.post import extract_post_content, fetch_image
+from PIL import ImageTk
+import asyncio
 import os
-import random
-import threading
 from .enum import Event
+from .utils.async_runner import AsyncRunner
+from .utils.balloon import BalloonCache
+from .utils.dispatch import UiDispatcher
+from .utils.polling import AdaptiveInterval, PollController, PollDeferred
+from .utils.post_buffer import PostBuffer
+from .utils.typewriter import Typewriter, wrap_text
+from .utils.widget_pool import WidgetPool
 
 
 class BubbleWindow(WindowBase):
@@ -20,10 +22,15 @@ class BubbleWindow(WindowBase):
     BALLOON_COLOR = "#EFFBFB"
     FONT_COLOR = "black"
     TRANSPARENT_COLOR = "#f0f0f0"
-    DEFAULT_POST_INTERVAL = 30  # seconds
-    TEXT_ANIMATION_DELAY = 50  # ms
+    DEFAULT_POST_INTERVAL = 30  # seconds（吹き出しを切り替える間隔）
+    MIN_FETCH_INTERVAL = 60  # seconds（タイムラインを取得する間隔の下限）
+    MAX_FETCH_INTERVAL = 15 * 60  # seconds（同・上限）
+    TEXT_REVEAL_SPEED = 20  # 1 秒あたりに表示する文字数（0 なら一度に表示）
+    TEXT_PADDING = 4
     LIKE_BUTTON_FONT = ("San Francisco", 22)
     LIKE_BUTTON_COLOR = "#ec4899"
+    PREFETCH_IMAGES = 3  # 次に表示する投稿の画像を先読みする件数
+    MAX_TIMELINE_REQUESTS_PER_HOUR = 120  # タイムライン取得リクエストの 1 時間あたりの上限
     
     def __init__(self, root, x_pos, y_pos):
         # ウィンドウサイズ設定
@@ -52,10 +59,29 @@ class BubbleWindow(WindowBase):
             topmost_flag=True,
         )
         
-        self.client = Client()
+        # 吹き出しの画像は (幅, 高さ) ごとに作り置きする
+        self.balloon_cache = BalloonCache(self.DEFAULT_WINDOW_WIDTH, self.BALLOON_COLOR)
+        self.balloon_item = None
+        # atproto / cryptography / requests は重いので、実際に使うまで import しない
+        self.client = None
+        # 取得した投稿はバッファにためて順に表示し、少なくなったら新着分だけ取得する。
+        # 取得の間隔は表示の間隔とは別に、新着のペースに合わせて伸び縮みさせる
+        self.fetch_interval = AdaptiveInterval(
+            min_sec=self.MIN_FETCH_INTERVAL,
+            max_sec=self.MAX_FETCH_INTERVAL,
+        )
+        self.post_buffer = PostBuffer(self._fetch_timeline_page, refill_interval=self.fetch_interval)
+        # タイムライン取得は常に 1 本だけ。失敗・429 ではバックオフし、1 時間あたりの回数も制限する
+        self.poll_controller = PollController(max_requests_per_hour=self.MAX_TIMELINE_REQUESTS_PER_HOUR)
+        # ワーカースレッドの結果は必ずこのキュー経由で Tk スレッドに渡す
+        self.dispatcher = UiDispatcher(self.window)
+        self.dispatcher.start()
+        # SNS の取得・画像取得・いいねは専用スレッドの asyncio ループ上のコルーチンで行う
+        self.sns_runner = AsyncRunner("sns-loop")
+        self.sns_runner.start()
+        self.sns_poll_task = None
         self._initialize_window()
         self._setup_authentication()
-        self._setup_sns_updates()
 
     def _initialize_window(self):
         """ウィンドウの基本設定を行う"""
@@ -72,133 +98,250 @@ class BubbleWindow(WindowBase):
             highlightthickness=0,
         )
         self.canvas.pack()
+        # 投稿本文を少しずつ表示する。吹き出しをクリックすると残りを一度に表示（ドラッグ用のバインドはそのまま）
+        self.typewriter = Typewriter(self.canvas, chars_per_sec=self.TEXT_REVEAL_SPEED)
+        self.canvas.bind("<Button-1>", lambda event: self.typewriter.skip() if self.typewriter.running else None, add="+")
+        # 投稿・メニュー画面のウィジェットは作り置きして使い回す（Canvas も作り直さない）
+        self.widget_pool = WidgetPool(
+            self.canvas,
+            {
+                "label": self._make_label,
+                "clickable": self._make_clickable_label,
+                "entry": lambda parent: tk.Entry(parent, font=self.font),
+                "button": self._make_button,
+                "image": lambda parent: tk.Label(parent, bg=self.BALLOON_COLOR, foreground=self.FONT_COLOR),
+                "like": self._make_like_label,
+            },
+        )
+
+    def _make_label(self, parent):
+        return tk.Label(parent, font=self.font, bg=self.BALLOON_COLOR, fg=self.FONT_COLOR)
+
+    def _make_clickable_label(self, parent):
+        """クリック可能なラベル。押されたら widget.command を呼ぶ"""
+        label = tk.Label(parent, font=self.font, bg=self.BALLOON_COLOR, fg=self.FONT_COLOR, cursor="hand2")
+        label.bind("<Button-1>", lambda e: e.widget.command())
+        label.bind("<Enter>", lambda e: self._highlight_label(e.widget))
+        label.bind("<Leave>", lambda e: self._unhighlight_label(e.widget))
+        label.original_font = label.cget("font")
+        return label
+
+    def _make_button(self, parent):
+        """ボタン。押されたら widget.on_press を呼ぶ"""
+        button = tk.Button(parent, font=self.font, bg="white")
+        button.configure(command=lambda: button.on_press())
+        return button
+
+    def _make_like_label(self, parent):
+        label = tk.Label(parent, font=self.LIKE_BUTTON_FONT, height=1, bg=self.BALLOON_COLOR)
+        label.bind("<Button-1>", lambda e: self._on_like_clicked())
+        return label
 
     def _setup_authentication(self):
-        """認証関連の初期設定"""
-        if not os.path.exists("data/secret.key"):
-            generate_key()
-        self.bluesky_login()
+        """認証関連の初期設定（ログインと最初の取得はワーカーで行う）"""
+        if not os.path.exists("data/credentials.json"):
+            return
+        self.display_connecting()
+        self.sns_runner.submit(self._login_and_fetch())
+
+    async def _login_and_fetch(self):
+        """保存済みの認証情報でログインし、最初の投稿を取得（SNS ループ）"""
+        logined = await asyncio.to_thread(self.bluesky_login)
+        render = None
+        if logined:
+            try:
+                render = await self._fetch_post_content()
+            except Exception as e:
+                print(f"Failed to fetch timeline: {e}")
+        self.dispatcher.post(self._on_startup_login_finished, logined, render)
+
+    def _on_startup_login_finished(self, logined, render):
+        """起動時ログインの結果を反映（Tk スレッド）"""
+        self.isLogined = logined
+        if not logined:
+            self.hide_balloon()
+            return
+        self._setup_sns_updates(render)
+
+    def _get_client(self):
+        """atproto クライアントを返す（初回呼び出し時に import・生成）"""
+        if self.client is None:
+            from atproto import Client
+
+            self.client = Client()
+            self.client.on_session_change(self._on_session_change)
+        return self.client
+
+    def _on_session_change(self, event, session):
+        """新規ログイン・トークン更新のたびにセッションを暗号化して保存"""
+        from atproto import SessionEvent
+        from .utils.password import save_session
+
+        if event in (SessionEvent.CREATE, SessionEvent.REFRESH):
+            try:
+                save_session(session.export())
+            except Exception as e:
+                print(f"Failed to save session: {e}")
 
-    def _setup_sns_updates(self):
+    def _setup_sns_updates(self, render):
         """SNS投稿更新の初期設定"""
         if self.isLogined:
             self.set_balloons()
-            self.update_sns_posts()
-            self._start_sns_update_timer()
-
-    def _start_sns_update_timer(self):
-        """SNS投稿更新タイマーを開始"""
-        self.update_sns_timer = threading.Timer(
-            self.DEFAULT_POST_INTERVAL, 
-            self.fetch_and_update_sns_posts
-        )
-        self.update_sns_timer.start()
+            if render is not None:
+                self._show_post_content(render)
+            self._start_sns_polling()
+
+    def _start_sns_polling(self, immediate=False):
+        """SNS投稿の定期取得を（張り直して）開始。同時に動くポーリングは常に 1 つだけ"""
+        self._cancel_sns_polling()
+        self.sns_poll_task = self.sns_runner.submit(self._sns_poll_loop(immediate))
+
+    def _cancel_sns_polling(self):
+        """定期取得を止める（取得中の通信・先読みもまとめてキャンセルされる）"""
+        if self.sns_poll_task is not None:
+            self.sns_poll_task.cancel()
+            self.sns_poll_task = None
+
+    async def _sns_poll_loop(self, immediate):
+        """DEFAULT_POST_INTERVAL ごとに投稿を取得して表示を依頼する（SNS ループ）"""
+        if not immediate:
+            await asyncio.sleep(self.DEFAULT_POST_INTERVAL)
+        while self._should_update_sns():
+            try:
+                await self.update_sns_posts()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Failed to update SNS posts: {e}")
+            await asyncio.sleep(self.DEFAULT_POST_INTERVAL)
 
     # === バルーン/UI関連メソッド ===
     def set_balloons(self):
-        """吹き出しのUIを設定"""
-        self._clear_canvas_elements("balloon")
+        """吹き出しのUIを設定
+
+        吹き出しは作り置きの画像 1 枚を 1 つの Canvas アイテムで表示し、
+        サイズが変わったときは画像と位置を差し替えるだけにする。
+        """
+        self.window_height = self.balloon_cache.bucket_height(self.window_height)
         self._adjust_window_size()
-        self._draw_balloon_tail()
-        self._draw_rounded_rectangle()
-        self.canvas.tag_lower("all")
+        photo = self.balloon_cache.get(self.window_width, self.window_height)
+        if self.balloon_item is None or not self.canvas.find_withtag(self.balloon_item):
+            self.balloon_item = self.canvas.create_image(0, 0, image=photo, anchor="nw", tags="balloon")
+        else:
+            self.canvas.itemconfigure(self.balloon_item, image=photo)
+            self.canvas.coords(self.balloon_item, 0, 0)
+        self.canvas.tag_lower(self.balloon_item)
 
-    def _clear_canvas_elements(self, tag):
-        """Canvas上の要素をクリア"""
-        self.canvas.delete(tag)
+    def _clear_canvas_elements(self):
+        """Canvas上の要素をクリア（吹き出しは残して使い回す）"""
+        self.widget_pool.release_all()
+        self.canvas.addtag_all("clearing")
+        self.canvas.dtag("balloon", "clearing")
+        self.canvas.delete("clearing")
 
     def _adjust_window_size(self):
         """ウィンドウサイズを調整"""
         self.window.geometry(f"{self.window_width}x{self.window_height}")
         self.canvas.config(height=self.window_height, width=self.window_width)
 
-    def _draw_balloon_tail(self):
-        """吹き出しのしっぽを描画"""
-        hukidasi_height = min(self.window_height / 2, 40)
-        triangle = [
-            (self.DEFAULT_WINDOW_WIDTH, hukidasi_height - 5),
-            (self.DEFAULT_WINDOW_WIDTH + 10, hukidasi_height),
-            (self.DEFAULT_WINDOW_WIDTH, hukidasi_height + 5),
-        ]
-        self.canvas.create_polygon(
-            triangle, 
-            fill=self.BALLOON_COLOR, 
-            outline=self.BALLOON_COLOR, 
-            tags="balloon"
-        )
-
-    def _draw_rounded_rectangle(self):
-        """角丸の長方形を描画"""
-        radius = 10
-        # 四隅の円
-        positions = [
-            (0, 0, radius * 2, radius * 2),  # 左上
-            (self.DEFAULT_WINDOW_WIDTH - radius * 2, 0, self.DEFAULT_WINDOW_WIDTH, radius * 2),  # 右上
-            (0, self.window_height - radius * 2, radius * 2, self.window_height),  # 左下
-            (self.DEFAULT_WINDOW_WIDTH - radius * 2, self.window_height - radius * 2, 
-             self.DEFAULT_WINDOW_WIDTH, self.window_height),  # 右下
-        ]
-        
-        for pos in positions:
-            self.canvas.create_oval(
-                *pos,
-                fill=self.BALLOON_COLOR,
-                outline=self.BALLOON_COLOR,
-                tags="balloon"
-            )
-        
-        # 中央部分
-        self.canvas.create_rectangle(
-            radius,
-            0,
-            self.DEFAULT_WINDOW_WIDTH - radius,
-            self.window_height,
-            fill=self.BALLOON_COLOR,
-            outline=self.BALLOON_COLOR,
-            tags="balloon",
-        )
-        self.canvas.create_rectangle(
-            0,
-            radius,
-            self.DEFAULT_WINDOW_WIDTH,
-            self.window_height - radius,
-            fill=self.BALLOON_COLOR,
-            outline=self.BALLOON_COLOR,
-            tags="balloon",
-        )
-
     # === SNS認証関連メソッド ===
     def bluesky_login(self):
-        """Blueskyにログイン"""
+        """保存済みの認証情報でBlueskyにログインし、成否を返す（ワーカースレッドから呼ぶ）
+
+        保存済みのセッションがあればそれを再利用し（期限切れのトークンは
+        atproto が自動で更新する）、使えない場合だけパスワードでログインする。
+        """
         if not os.path.exists("data/credentials.json"):
-            return
+            return False
+
+        from .utils.password import delete_session, load_credentials, load_session
+
+        client = self._get_client()
+        try:
+            session_string = load_session()
+            if session_string:
+                client.login(session_string=session_string)
+                return True
+        except Exception as e:
+            print(f"Session resume failed, falling back to password login: {e}")
+            delete_session()
 
-        loaded_username, loaded_password = load_credentials()
         try:
-            self.client.login(loaded_username, loaded_password)
-            self.isLogined = True
+            loaded_username, loaded_password = load_credentials()
+            client.login(loaded_username, loaded_password)
+            return True
         except Exception as e:
             print(f"Login failed: {e}")
-            self.isLogined = False
+            return False
 
     # === SNS投稿表示関連メソッド ===
-    def update_sns_posts(self):
-        """SNS投稿を更新"""
+    async def update_sns_posts(self):
+        """SNS投稿を取得し、表示を Tk スレッドに依頼（SNS ループ）
+
+        ループ側は通信・解析・画像デコードだけを行い、Tk には一切触れない。
+        結果は PostRender としてディスパッチキューに積み、Tk スレッドが描画する。
+        """
         if not self._should_update_sns():
             return
-            
-        self._reset_like_button_state()
-        self._clear_post_content()
-        
-        response = self._safe_timeline()
-        if not response.feed:
-            return
-            
-        post = self._select_random_post(response)
+
+        render = await self._fetch_post_content()
+        if render is not None:
+            self.dispatcher.post(self._show_post_content, render)
+        await self._prefetch_images()
+
+    def _image_box(self):
+        """投稿画像の表示枠（幅, 高さ）"""
+        return self.window_width - 50, 330
+
+    async def _fetch_post_content(self):
+        """タイムラインから投稿を選び、PostRender を作る（SNS ループ・Tk は触らない）"""
+        from .utils.post import PostRender, extract_post_content
+
+        post = await asyncio.to_thread(self.post_buffer.next_post)
+        if post is None:
+            return None
+
+        max_width, max_height = self._image_box()
+        post_text, image_url = extract_post_content(post, max_width=max_width, max_height=max_height)
+        image = None
+        if image_url:
+            image = await self._fetch_image(image_url)
+        return PostRender(
+            uri=post.uri,
+            cid=post.cid,
+            text=post_text,
+            image_url=image_url,
+            image=image,
+            liked=post.viewer.like is not None,
+        )
+
+    async def _fetch_image(self, image_url):
+        """投稿画像を取得・縮小（画像キャッシュにも入る）"""
+        from .utils.post import fetch_image
+
+        max_width, max_height = self._image_box()
+        return await asyncio.to_thread(fetch_image, image_url, max_width, max_height)
+
+    async def _prefetch_images(self):
+        """次に表示する投稿の画像を並行して取得し、キャッシュを温めておく"""
+        from .utils.post import extract_post_content
+
+        max_width, max_height = self._image_box()
+        urls = []
+        for post in self.post_buffer.peek(self.PREFETCH_IMAGES):
+            _, image_url = extract_post_content(post, max_width=max_width, max_height=max_height)
+            if image_url:
+                urls.append(image_url)
+        await asyncio.gather(*(self._fetch_image(url) for url in urls), return_exceptions=True)
+
+    def _show_post_content(self, render):
+        """取得済みの投稿を表示（Tk スレッド）"""
         if not self._should_update_sns():  # 再度チェック
             return
-            
-        self._display_post_content(post)
+
+        self._reset_like_button_state()
+        self._clear_post_content()
+        self._display_post_content(render)
 
     def _should_update_sns(self):
         """SNS更新が必要かチェック"""
@@ -210,117 +353,79 @@ class BubbleWindow(WindowBase):
 
     def _clear_post_content(self):
         """投稿内容をクリア"""
-        self.canvas.delete("all")
+        self.typewriter.cancel()
+        self._clear_canvas_elements()
 
-    def _select_random_post(self, response):
-        """ランダムに投稿を選択"""
-        rand_int = random.randint(0, len(response.feed) - 1)
-        return response.feed[rand_int].post
-
-    def _display_post_content(self, post):
+    def _display_post_content(self, render):
         """投稿内容を表示"""
-        post_text, image_url = extract_post_content(post)
-        print(f"Image URL: {image_url}")
+        print(f"Image URL: {render.image_url}")
 
-        self._display_text_content(post_text)
-        self._display_image_content(image_url)
-        self._display_like_button(post)
-        self._adjust_window_height(post_text, image_url)
+        self._display_text_content(render.text)
+        self._display_image_content(render.image)
+        self._display_like_button(render)
+        self._adjust_window_height(render.text, render.image_url)
         self.set_balloons()
 
     def _display_text_content(self, post_text):
-        """テキスト内容を表示"""
+        """テキスト内容を表示（折り返しは最初に 1 回だけ計算し、Typewriter で少しずつ出す）"""
         if not post_text.strip():
+            self.label_height = 0
             return
-            
-        self.post_label = tk.Message(
-            self.canvas,
-            text=post_text,
-            width=self.window_width - 50,
-            anchor="nw",
-            justify="left",
-            bg=self.BALLOON_COLOR,
+
+        lines = wrap_text(post_text, self.font, self.window_width - 50 - 2 * self.TEXT_PADDING)
+        line_height = self.font.metrics("linespace")
+        self.label_height = len(lines) * line_height + 2 * self.TEXT_PADDING
+        self.typewriter.start(
+            lines,
+            5 + self.TEXT_PADDING,
+            10 + self.TEXT_PADDING,
+            line_height,
             font=self.font,
-            fg=self.FONT_COLOR,
+            fill=self.FONT_COLOR,
+            tags="post_text",
         )
-        self.canvas.create_window(5, 10, window=self.post_label, anchor="nw", tags="post_text")
-        self.label_height = self.post_label.winfo_reqheight()
-        self.current_text_index = 0
-        self.full_text = post_text
-        self._animate_text_display()
-
-    def _animate_text_display(self):
-        """テキストをアニメーション表示"""
-        if self.current_text_index < len(self.full_text):
-            self.post_label.config(text=self.full_text[:self.current_text_index + 1])
-            self.current_text_index += 1
-            self.canvas.after(self.TEXT_ANIMATION_DELAY, self._animate_text_display)
-        else:
-            self.display_image()
 
-    def _display_image_content(self, image_url):
+    def _display_image_content(self, image):
         """画像内容を表示"""
-        self.image_height = 0
-        self.image = None
-        
-        if image_url:
-            self.image = fetch_image(
-                image_url, 
-                max_width=self.window_width - 50, 
-                max_height=330
-            )
-            self.image_height = self.image.height if self.image else 0
+        self.image = image
+        self.image_height = image.height if image else 0
+        if image:
             self.display_image()
 
     def display_image(self):
         """画像を表示"""
         if hasattr(self, "image") and self.image:
             self.photo_image = ImageTk.PhotoImage(self.image)
-            image_label = tk.Label(
-                self.canvas, 
-                image=self.photo_image, 
-                bg=self.BALLOON_COLOR, 
-                foreground=self.FONT_COLOR
-            )
-            self.canvas.create_window(
-                5, 
-                self.label_height + 20, 
-                window=image_label, 
-                anchor="nw", 
-                tags="post_image"
-            )
-
-    def _display_like_button(self, post):
+            self.widget_pool.place("image", 5, self.label_height + 20, image=self.photo_image)
+
+    def _display_like_button(self, render):
         """いいねボタンを表示"""
-        if post.viewer.like is None:
-            self._create_like_button(post, "♡", "lightgray")
+        if not render.liked:
+            self._create_like_button(render, "♡", "lightgray")
         else:
-            self._create_like_button(post, "♥", self.LIKE_BUTTON_COLOR, pressed=True)
+            self._create_like_button(render, "♥", self.LIKE_BUTTON_COLOR, pressed=True)
 
-    def _create_like_button(self, post, text, color, pressed=False):
+    def _create_like_button(self, render, text, color, pressed=False):
         """いいねボタンを作成"""
-        self.like_label = tk.Label(
-            self.canvas,
-            text=text,
-            font=self.LIKE_BUTTON_FONT,
-            height=1,
-            fg=color,
-            bg=self.BALLOON_COLOR,
-            cursor="hand2" if not pressed else "",
-        )
-        
-        if not pressed:
-            self.like_label.bind(
-                "<Button-1>", 
-                lambda event: self.like_post(post.uri, post.cid)
-            )
-            
+        self.like_render = None if pressed else render
         like_label_y = (
             self.label_height + 20 + self.image_height + 1 
             if self.image_height > 0 
             else self.label_height + 6
         )
-        self.canvas.create_window(7, like_label_y, anchor="nw", window=self.like_label)
+        self.like_label = self.widget_pool.place(
+            "like",
+            7,
+            like_label_y,
+            text=text,
+            fg=color,
+            cursor="hand2" if not pressed else "",
+        )
+
+    def _on_like_clicked(self):
+        """いいねボタンが押された"""
+        if self.like_render is not None:
+            self.like_post(self.like_render.uri, self.like_render.cid)
 
     def _adjust_window_height(self, post_text, image_url):
         """ウィンドウ高さを調整"""
@@ -332,22 +437,50 @@ class BubbleWindow(WindowBase):
     def like_post(self, uri, cid):
         """投稿にいいねする"""
         if not self.like_button_pressed:
-            self.like_label.config(text="♥", fg=self.LIKE_BUTTON_COLOR, font=self.LIKE_BUTTON_FONT)
-            self.client.like(uri=uri, cid=cid)
+            self.like_label.config(text="♥", fg=self.LIKE_BUTTON_COLOR, cursor="")
+            # 通信は SNS ループで行い、UI は先に更新しておく
+            self.sns_runner.submit(self._send_like(uri, cid))
             self.like_button_pressed = True
             self.notify_observers(Event.SET_WINDOWPOS)
 
-    def _safe_timeline(self, limit=50):
+    def _fetch_timeline_page(self, limit, cursor):
+        """PostBuffer 用：タイムラインを 1 ページ取得
+
+        送れなかったとき・失敗したときは報告して例外をそのまま投げる。PostBuffer は
+        その回の補充を打ち切り、バッファに残っている投稿（なければ最近表示した投稿）の
+        表示を続ける。
+        """
+        try:
+            response = self.poll_controller.call(self._safe_timeline, limit, cursor)
+        except PollDeferred as e:
+            print(f"Timeline request skipped: {e}")
+            raise
+        except Exception as e:
+            print(f"Timeline request failed: {e}")
+            raise
+        return response.feed, response.cursor
+
+    async def _send_like(self, uri, cid):
+        """いいねを送信（SNS ループ）"""
+        try:
+            await asyncio.to_thread(self.client.like, uri=uri, cid=cid)
+        except Exception as e:
+            print(f"Like failed: {e}")
+
+    def _safe_timeline(self, limit=50, cursor=None):
         """
         タイムラインを安全に取得
         1) 通常の strict=True で試す
         2) ModelError → strict 検証を完全に回避した RAW 版で再取得
         """
+        from atproto_client.exceptions import ModelError
+
         try:
-            return self.client.get_timeline(limit=limit)  # strict=True
+            return self.client.get_timeline(limit=limit, cursor=cursor)  # strict=True
         except ModelError as e:
             print(f"strict mode failed, switch to raw: {e}")
-            raw = self.client.app.bsky.feed.get_timeline_raw(params={"limit": limit})
+            params = {"limit": limit} if cursor is None else {"limit": limit, "cursor": cursor}
+            raw = self.client.app.bsky.feed.get_timeline_raw(params=params)
             
             class _Dummy:
                 def __init__(self, d):
@@ -356,21 +489,11 @@ class BubbleWindow(WindowBase):
             return _Dummy(raw)
 
     # === SNS更新スケジューリング関連 ===
-    def update_sns_posts_async(self):
-        """非同期でSNS投稿を更新"""
-        if self._should_update_sns():
-            self._start_sns_update_timer()
-
-    def fetch_and_update_sns_posts(self):
-        """SNS投稿を取得して更新"""
-        self.update_sns_posts()
-        self.update_sns_posts_async()
-
     def stop_update_sns_posts(self):
         """SNS投稿更新を停止"""
         self.stop_post_update = True
-        if hasattr(self, 'update_sns_timer') and self.update_sns_timer:
-            self.update_sns_timer.cancel()
+        self._cancel_sns_polling()
+        self.typewriter.cancel()
 
     # === メニュー関連メソッド ===
     def menu_mode(self):
@@ -378,22 +501,9 @@ class BubbleWindow(WindowBase):
         self.stop_update_sns_posts()
         self.window.lift()
         self.show_balloon()
-        self._reinitialize_canvas()
+        self._clear_canvas_elements()
         self._display_menu_options()
 
-    def _reinitialize_canvas(self):
-        """Canvasを再初期化"""
-        self.canvas.destroy()
-        self.canvas = tk.Canvas(
-            self.window,
-            width=self.window_width,
-            height=self.window_height,
-            bg=self.TRANSPARENT_COLOR,
-            highlightthickness=0,
-        )
-        self.canvas.pack()
-        self.canvas.delete("all")
-
     def _display_menu_options(self):
         """メニューオプションを表示"""
         options = ["SNS (Bluesky)の設定をする", "さようなら", "なんでもない"]
@@ -407,29 +517,16 @@ class BubbleWindow(WindowBase):
 
     def _create_menu_label(self, option, y_position):
         """メニューラベルを作成"""
-        label = tk.Label(
-            self.canvas,
+        label = self.widget_pool.place(
+            "clickable",
+            10,
+            y_position + 10,
             text=option,
-            font=self.font,
             bg=self.BALLOON_COLOR,
             anchor="nw",
             justify="left",
-            cursor="hand2",
-            foreground=self.FONT_COLOR,
         )
-        
-        # イベントバインディング
-        bindings = {
-            "<Button-1>": lambda e, opt=option: self._handle_menu_selection(opt),
-            "<Enter>": lambda e, lbl=label: self._highlight_label(lbl),
-            "<Leave>": lambda e, lbl=label: self._unhighlight_label(lbl),
-        }
-        
-        for event, callback in bindings.items():
-            label.bind(event, callback)
-            
-        label.original_font = label.cget("font")
-        self.canvas.create_window(10, y_position + 10, anchor="nw", window=label)
+        label.command = lambda opt=option: self._handle_menu_selection(opt)
         return label
 
     def _adjust_menu_window_size(self, total_height):
@@ -461,7 +558,7 @@ class BubbleWindow(WindowBase):
     # === メニューオプション処理 ===
     def handle_sns_settings(self):
         """SNS設定メニューを表示"""
-        self.canvas.delete("all")
+        self._clear_canvas_elements()
         
         # ログインオプション
         login_label = self._create_clickable_label(
@@ -489,21 +586,17 @@ class BubbleWindow(WindowBase):
 
     def _create_clickable_label(self, text, command, y_position):
         """クリック可能なラベルを作成"""
-        label = tk.Label(
-            self.canvas,
+        # 使い回しなので、メニュー用に変えた配置も既定値に戻す
+        label = self.widget_pool.place(
+            "clickable",
+            10,
+            y_position,
             text=text,
-            font=self.font,
             bg=self.BALLOON_COLOR,
-            fg=self.FONT_COLOR,
-            cursor="hand2",
+            anchor="center",
+            justify="center",
         )
-        
-        label.bind("<Button-1>", lambda e: command())
-        label.bind("<Enter>", lambda e, lbl=label: self._highlight_label(lbl))
-        label.bind("<Leave>", lambda e, lbl=label: self._unhighlight_label(lbl))
-        label.original_font = label.cget("font")
-        
-        self.canvas.create_window(10, y_position, anchor="nw", window=label)
+        label.command = command
         return label
 
     def toggle_sns_display(self):
@@ -524,7 +617,7 @@ class BubbleWindow(WindowBase):
     # === ログイン関連メソッド ===
     def display_login_form(self):
         """ログインフォームを表示"""
-        self.canvas.delete("all")
+        self._clear_canvas_elements()
         
         # タイトル
         self._create_static_label("IDとパスワードを入力してね", 10)
@@ -539,58 +632,70 @@ class BubbleWindow(WindowBase):
         
         # 保存された認証情報を読み込む
         if os.path.exists("data/credentials.json"):
+            from .utils.password import load_credentials
+
             loaded_username, loaded_password = load_credentials()
             self.id_entry.insert(0, loaded_username)
             self.pw_entry.insert(0, loaded_password)
         
         # OKボタン
-        ok_button = tk.Button(
-            self.canvas,
-            text="OK",
-            font=self.font,
-            command=lambda: self.attempt_login(
-                self.id_entry.get(),
-                self.pw_entry.get()
-            ),
-            bg="white",
+        ok_button = self.widget_pool.place("button", 10, 100, text="OK")
+        ok_button.on_press = lambda: self.attempt_login(
+            self.id_entry.get(),
+            self.pw_entry.get()
         )
-        self.canvas.create_window(10, 100, anchor="nw", window=ok_button)
         
         self._adjust_menu_window_size(150)
 
     def _create_static_label(self, text, y_position):
         """静的なラベルを作成"""
-        label = tk.Label(
-            self.canvas,
-            text=text,
-            font=self.font,
-            bg=self.BALLOON_COLOR,
-            fg=self.FONT_COLOR,
-        )
-        self.canvas.create_window(10, y_position, anchor="nw", window=label)
-        return label
+        return self.widget_pool.place("label", 10, y_position, text=text)
 
     def _create_entry(self, x, y, show=None):
         """入力フィールドを作成"""
-        entry = tk.Entry(self.canvas, font=self.font, show=show)
-        self.canvas.create_window(x, y, anchor="nw", window=entry)
+        entry = self.widget_pool.place("entry", x, y, show=show or "")
+        entry.delete(0, tk.END)
         return entry
 
     def attempt_login(self, username, password):
-        """ログインを試行"""
+        """ログインを試行（通信は SNS ループで行い、結果は Tk スレッドで表示）"""
+        self.display_connecting()
+        self.sns_runner.submit(self._attempt_login(username, password))
+
+    async def _attempt_login(self, username, password):
+        logined = await asyncio.to_thread(self._login_with_password, username, password)
+        self.dispatcher.post(self._on_attempt_login_finished, logined)
+
+    def _login_with_password(self, username, password):
+        """入力された ID・パスワードでログインし、保存する（ワーカースレッド）"""
+        from .utils.password import generate_key, save_credentials
+
         try:
-            self.client.login(username, password)
+            # ログイン時にセッションを暗号化して保存するので、鍵を先に用意する
+            if not os.path.exists("data/secret.key"):
+                generate_key()
+            self._get_client().login(username, password)
             save_credentials(username, password)
-            self.display_login_result("ログインしたよ")
-            self.isLogined = True
+            self.post_buffer.clear()
+            return True
         except Exception as e:
             print(f"Login error: {e}")
-            self.display_login_result("失敗したよ……")
-            self.isLogined = False
+            return False
+
+    def _on_attempt_login_finished(self, logined):
+        """フォームからのログイン結果を表示（Tk スレッド）"""
+        self.isLogined = logined
+        self.display_login_result("ログインしたよ" if logined else "失敗したよ……")
+
+    def display_connecting(self):
+        """ログイン中の表示"""
+        self._clear_canvas_elements()
+        self._create_static_label("接続中…", 10)
+        self._adjust_menu_window_size(40)
 
     def display_login_result(self, message):
         """ログイン結果を表示"""
-        self.canvas.delete("all")
+        self._clear_canvas_elements()
         self._create_static_label(message, 10)
         
         self._adjust_menu_window_size(50)
@@ -615,7 +720,7 @@ class BubbleWindow(WindowBase):
     # === 確認メッセージ表示 ===
     def display_confirmation_and_return(self):
         """確認メッセージを表示して戻る"""
-        self.canvas.delete("all")
+        self._clear_canvas_elements()
         self._create_static_label("おっけー", 10)
         
         self._adjust_menu_window_size(40)
@@ -628,7 +733,7 @@ class BubbleWindow(WindowBase):
     def display_goodbye_and_exit(self):
         """さよならメッセージを表示して終了"""
         self.stop_update_sns_posts()
-        self.canvas.delete("all")
+        self._clear_canvas_elements()
         self._create_static_label("じゃあね！", 10)
         
         self._adjust_menu_window_size(40)
@@ -636,15 +741,17 @@ class BubbleWindow(WindowBase):
 
     def exit_application(self):
         """アプリケーションを終了"""
-        if hasattr(self, 'update_sns_timer'):
-            self.update_sns_timer.join()
+        self.sns_runner.stop()
+        self.dispatcher.stop()
+        # メモの書き込み待ちなどを済ませてから終了する（書き込みスレッドは daemon なので待たないと消える）
+        self.notify_observers(Event.EXIT_APPLICATION)
         self.root.destroy()
 
     def return_to_sns_mode(self):
         """SNSモードに戻る"""
         self.hide_balloon()
         self.stop_post_update = False
-        self.fetch_and_update_sns_posts()
+        self._start_sns_polling(immediate=True)
         self.show_balloon()
 
     # === イベントハンドリング ===
@@ -3,12 +3,15 @@ from __future__ import annotations
 import random
 import tkinter as tk
 from pathlib import Path
-from typing import List, Tuple
+from typing import List
 
-from PIL import Image, ImageTk
+from PIL import Image
 
 from .base_window import WindowBase
 from .enum import Event
+from .utils.asset_loader import AssetLoader
+from .utils.frame_ring import DeltaFrameRing
+from .utils.sprite_cache import load_sprite
 
 
 class CharacterWindow(WindowBase):
@@ -18,6 +21,10 @@ class CharacterWindow(WindowBase):
     DEFAULT_IMAGE = Path("./assets/image/tekku_0.png")
     BLINK_IMAGES = [Path("./assets/image/tekku_1.png"), Path("./assets/image/tekku_2.png")]
 
+    #: 背景として透過するキー色と許容値
+    KEY_COLOR = (255, 0, 0)
+    KEY_TOLERANCE = 35
+
     #: まばたき間隔の候補（秒）とその確率
     BLINK_INTERVALS = [1, 2, 3, 4, 5]
     BLINK_PROBS = [0.45, 0.25, 0.20, 0.08, 0.02]
@@ -26,7 +33,14 @@ class CharacterWindow(WindowBase):
     BLINK_SEQUENCE = [0, 1, 2, 1, 0]
     BLINK_TIMES = [0.08, 0.06, 0.05, 0.06, 0.08]  # 秒
 
-    def __init__(self, root, syncronized_windows: List[WindowBase], x_pos: int, y_pos: int):
+    def __init__(
+        self,
+        root,
+        syncronized_windows: List[WindowBase],
+        x_pos: int,
+        y_pos: int,
+        asset_loader: AssetLoader | None = None,
+    ):
         # ウィンドウサイズ（画像リサイズ上限）
         self.pic_x = 250
         self.pic_y = 1000
@@ -47,20 +61,18 @@ class CharacterWindow(WindowBase):
         self.canvas.pack()
         self.window.attributes("-transparentcolor", self.window["bg"])
 
-        # ---------- 画像ロード ---------- #
-        self.character_images: List[ImageTk.PhotoImage] = []
-        self._load_images()
-
-        # 画像をキャンバスに配置
-        self.image_ids: List[int] = [
-            self.canvas.create_image(0, 0, image=img, anchor=tk.NW) for img in self.character_images
-        ]
-        self.current_image_index = 0
-        self._update_image_visibility()
-
         # ---------- まばたきタイマー（after 版） ---------- #
         self.blink_timer: int | None = None  # after() の戻り値（ID）を保持
-        self._schedule_blink()
+
+        # ---------- 画像ロード ---------- #
+        # asset_loader があれば空のキャンバスのまま先に表示し、画像は読み込み後に差し込む
+        self.frame_ring: DeltaFrameRing | None = None
+        # フレームごとに別のワーカーで読み込み、全部そろったら差し込む
+        paths = [self.DEFAULT_IMAGE] + self.BLINK_IMAGES
+        if asset_loader:
+            asset_loader.submit_many(self._load_image, paths, on_ready=self._set_images)
+        else:
+            self._set_images([self._load_image(p) for p in paths])
 
         # memo_window を常に手前に（同期リストの先頭想定）
         if syncronized_windows:
@@ -69,47 +81,17 @@ class CharacterWindow(WindowBase):
     # ------------------------------------------------------------------ #
     # 画像関連
     # ------------------------------------------------------------------ #
-    def _load_images(self) -> None:
-        """デフォルト + まばたき画像を読み込み、リサイズ後リストへ格納"""
-        self.character_images.clear()
-        paths = [self.DEFAULT_IMAGE] + self.BLINK_IMAGES
-        for p in paths:
-            if not p.is_file():
-                raise FileNotFoundError(p)
-            self.character_images.append(self._prepare_image(Image.open(p)))
-
-    def _prepare_image(self, image: Image.Image) -> ImageTk.PhotoImage:
-        image = self._make_background_fully_transparent(image, (255, 0, 0), tolerance=35)
-        image = self._resize_image(image, self.pic_x, self.pic_y)
-        return ImageTk.PhotoImage(image)
-
-    @staticmethod
-    def _resize_image(image: Image.Image, max_w: int, max_h: int) -> Image.Image:
-        ratio = min(max_w / image.width, max_h / image.height)
-        return image.resize((int(image.width * ratio), int(image.height * ratio)))
-
-    @staticmethod
-    def _make_background_fully_transparent(
-        image: Image.Image, color: Tuple[int, int, int], tolerance: int
-    ) -> Image.Image:
-        image = image.convert("RGBA")
-        datas = [
-            (255, 255, 255, 0) if all(abs(c - ref) <= tolerance for c, ref in zip(pixel[:3], color)) else pixel
-            for pixel in image.getdata()
-        ]
-        image.putdata(datas)
-        # 半透明ピクセルを完全透明に
-        w, h = image.size
-        for x in range(w):
-            for y in range(h):
-                *rgb, a = image.getpixel((x, y))
-                if a != 255:
-                    image.putpixel((x, y), (*rgb, 0))
-        return image
-
-    def _update_image_visibility(self) -> None:
-        for idx, item in enumerate(self.image_ids):
-            self.canvas.itemconfig(item, state="normal" if idx == self.current_image_index else "hidden")
+    def _load_image(self, path: Path) -> Image.Image:
+        """デフォルトまたはまばたきの画像 1 枚を読み込み、リサイズ済みで返す"""
+        if not path.is_file():
+            raise FileNotFoundError(path)
+        return load_sprite(path, self.KEY_COLOR, self.KEY_TOLERANCE, self.pic_x, self.pic_y)
+
+    def _set_images(self, images: List[Image.Image]) -> None:
+        """読み込んだ画像を配置し、まばたきを開始（Tk スレッドで呼ぶ）"""
+        # ベース画像 1 枚を置き、まばたきは目の周りの差分パッチを貼り替えて表現する
+        self.frame_ring = DeltaFrameRing(self.canvas, images)
+        self._schedule_blink()
 
     # ------------------------------------------------------------------ #
     # イベントオーバーライド
@@ -176,18 +158,4 @@ class CharacterWindow(WindowBase):
         """まばたき開始（相対位置・透過も確認）"""
         self._check_relative_positions()
         self._check_transparency()
-        self.blink_index = 0
-        self._blink_step()
-
-    def _blink_step(self):
-        """1 ステップ分フレームを進め、次をスケジュール"""
-        if self.blink_index >= len(self.BLINK_SEQUENCE):
-            self._schedule_blink()
-            return
-
-        self.current_image_index = self.BLINK_SEQUENCE[self.blink_index]
-        self._update_image_visibility()
-
-        delay_sec = self.BLINK_TIMES[self.blink_index]
-        self.blink_index += 1
-        self.blink_timer = self.window.after(int(delay_sec * 1000), self._blink_step)
+        self.frame_ring.play(self.BLINK_SEQUENCE, self.BLINK_TIMES, on_done=self._schedule_blink)
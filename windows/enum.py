@@ -5,3 +5,4 @@ class Event(enum.Enum):
     TRUNSLUCENT = 0
     START_MENU_MODE = 1  # キャラウィンドウをダブルクリックしたときにメニューモードに切り替える
     SET_WINDOWPOS = 2  # ウィンドウの位置を調整する（ディスプレイ接続時に位置がずれるのを直す）
+    EXIT_APPLICATION = 3  # アプリを終了する直前（root.destroy の前）。保存などの後始末をする
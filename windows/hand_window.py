@@ -1,10 +1,14 @@
 from .base_window import WindowBase
 import tkinter as tk
 from PIL import Image, ImageTk
+from .utils.asset_loader import AssetLoader
+from .utils.sprite_cache import load_sprite
 
 
 class HandWindow(WindowBase):
-    def __init__(self, root, x_pos, y_pos):
+    IMAGE_PATH = "./assets/image/hand_250.png"
+
+    def __init__(self, root, x_pos, y_pos, asset_loader: AssetLoader | None = None):
         self.pic_x = 250
         self.pic_y = 1000
         super().__init__(
@@ -24,21 +28,18 @@ class HandWindow(WindowBase):
         # ウィンドウの背景を透明に設定
         self.window.attributes("-transparentcolor", self.window["bg"])
 
-        # 画像をロードしてリサイズ
-        image = Image.open("./assets/image/hand_250.png")
-
-        # 背景を透明に変換
-        image = self.make_background_fully_transparent(image, (255, 0, 0), tolerance=15)
+        # 画像をロード（asset_loader があれば読み込み後に差し込む）
+        if asset_loader:
+            asset_loader.submit(self._load_image, on_ready=self._set_image)
+        else:
+            self._set_image(self._load_image())
 
-        # 画像の比率を保ったままリサイズ
-        original_width, original_height = image.size
-        max_width, max_height = self.pic_x, self.pic_y
+    def _load_image(self) -> Image.Image:
+        # 背景を透明にして比率を保ったままリサイズ（キャッシュ付き）
+        return load_sprite(self.IMAGE_PATH, (255, 0, 0), 15, self.pic_x, self.pic_y)
 
-        ratio = min(max_width / original_width, max_height / original_height)
-        new_width = int(original_width * ratio)
-        new_height = int(original_height * ratio)
-
-        resized_image = image.resize((new_width, new_height))
+    def _set_image(self, resized_image: Image.Image) -> None:
+        new_width, new_height = resized_image.size
         self.hand_image = ImageTk.PhotoImage(resized_image)
 
         # キャンバスのサイズをリサイズ後の画像サイズに合わせる
@@ -46,26 +47,3 @@ class HandWindow(WindowBase):
 
         # 画像をキャンバスに表示
         self.canvas.create_image(new_width // 2, new_height // 2, image=self.hand_image, anchor=tk.CENTER)
-
-    def make_background_fully_transparent(self, image, color, tolerance):
-        image = image.convert("RGBA")
-        datas = image.getdata()
-
-        new_data = []
-        for item in datas:
-            # 指定した色に近い場合に完全に透明に変換
-            if all(abs(item[i] - color[i]) <= tolerance for i in range(3)):
-                new_data.append((255, 255, 255, 0))  # 完全に透明に変換
-            else:
-                new_data.append(item)
-
-        image.putdata(new_data)
-
-        # 半透明部分を完全に透明に変換
-        for y in range(image.height):
-            for x in range(image.width):
-                r, g, b, a = image.getpixel((x, y))
-                if a != 255:  # 半透明ピクセル
-                    image.putpixel((x, y), (r, g, b, 0))
-
-        return image
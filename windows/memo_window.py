@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import bisect
+import os
 import re
+import time
 import webbrowser
+from collections import OrderedDict
 from pathlib import Path
 import tkinter as tk
 from tkinter import font, ttk  # noqa: F401  # imported for future use / consistency with other windows
@@ -9,13 +13,196 @@ from tkinter import font, ttk  # noqa: F401  # imported for future use / consist
 import customtkinter as ctk
 
 from .base_window import WindowBase
-from .enum import Event  # noqa: F401  # imported for potential callbacks elsewhere
+from .enum import Event
+from .utils.autosave import BackgroundSaver
+from .utils.memo_decorator import MemoDecorator
+from .utils.memo_journal import MemoJournal, journal_has_records, read_memo
+from .utils.memo_loader import ChunkedLoader, iter_file_chunks, iter_text_chunks
+from .utils.memo_search import MemoSearchIndex
+from .utils.startup import PROFILING
+from .utils.text_edits import TextEditTracker
 
 __all__ = ["MemoWindow"]
 
+# page names become file names under PAGES_DIR, so they follow the Windows rules:
+# no reserved device names (also as "CON.notes"), no control characters, and no
+# leading or trailing dot or space
+PAGE_NAME_RE = re.compile(
+    r"(?!(?:CON|PRN|AUX|NUL|COM[0-9¹²³]|LPT[0-9¹²³])(?:\.|$))"
+    r'[^\\/:*?"<>|.\s\x00-\x1f\x7f][^\\/:*?"<>|\x00-\x1f\x7f]{0,63}(?<![.\s])',
+    re.IGNORECASE,
+)
+
+
+class MemoPage:
+    """One named memo page: its Text buffer with edit tracking, decoration, search and storage.
+
+    Pages are created hidden and start streaming their file in right away;
+    *MemoWindow* packs the active one and keeps a few recent pages alive.
+    """
+
+    def __init__(self, owner: MemoWindow, name: str) -> None:
+        self.owner = owner
+        self.name = name
+        self.path: Path = owner.pages_dir / f"{name}.txt"
+        self.journal_path: Path = owner.pages_dir / f"{name}.journal"
+        self.last_used: float = time.monotonic()
+
+        self.text_widget = tk.Text(
+            owner.inner_frame,
+            wrap=tk.WORD,
+            bd=0,
+            bg=owner.FG_INNER,
+            fg=owner.TEXT_FG,
+            yscrollcommand=self.decorate_visible,
+        )
+
+        # tag styles
+        self.text_widget.tag_configure("link", foreground=owner.LINK_FG, underline=True)
+        self.text_widget.tag_configure("checked", foreground=owner.CHECKED_FG, overstrike=True)
+        self.text_widget.tag_configure("search_hit", background=owner.SEARCH_HIT_BG)
+        self.text_widget.tag_configure("search_current", background=owner.SEARCH_CURRENT_BG)
+        self.text_widget.tag_raise("search_current", "search_hit")
+
+        # every insert/delete is reported by the tracker; the decorator re-tags
+        # only the edited lines once typing pauses
+        self.edit_tracker = TextEditTracker(self.text_widget)
+        self.decorator = MemoDecorator(self.text_widget, self.edit_tracker, owner.DECORATE_DELAY_MS)
+        # the search index follows the same edit events, re-reading edited lines on idle
+        self.search_index = MemoSearchIndex(self.text_widget, self.edit_tracker)
+
+        # event bindings
+        self.text_widget.bind("<Button-1>", self._on_click)
+        self.text_widget.tag_bind("link", "<Double-1>", self._open_link)
+        owner.bind_search_keys(self.text_widget)
+
+        if owner.JOURNAL_ENABLED:
+            self.saver = None
+            self.journal = MemoJournal(self.path, self.journal_path, owner.JOURNAL_COMPACT_BYTES)
+        else:
+            self.saver = BackgroundSaver(self.path, name=f"memo-autosave-{name}")
+            self.journal = None
+        self._load_text()
+
+    def touch(self) -> None:
+        self.last_used = time.monotonic()
+
+    def report(self) -> str:
+        """Bytes written and write latency of the storage, plus load and search statistics."""
+        storage = self.saver.stats.report() if self.saver is not None else self.journal.stats.report()
+        return f"[{self.name}] {storage} | load {self.loader.stats.report()} | search {self.search_index.report()}"
+
+    # ------------------------------------------------------------------
+    # click / URL handling
+    # ------------------------------------------------------------------
+    def _on_click(self, event: tk.Event) -> None:
+        idx = self.text_widget.index(f"@{event.x},{event.y}")
+        line_start = f"{idx.split('.')[0]}.0"
+        line_text = self.text_widget.get(line_start, f"{line_start} lineend")
+
+        if line_text.startswith("☐ "):
+            self._toggle_checkbox(line_start, "☐ ", "☑ ")
+        elif line_text.startswith("☑ "):
+            self._toggle_checkbox(line_start, "☑ ", "☐ ")
+
+        self.decorator.flush()
+
+    def _toggle_checkbox(self, line_start: str, old: str, new: str) -> None:
+        self.text_widget.delete(line_start, f"{line_start}+{len(old)}c")
+        self.text_widget.insert(line_start, new)
+
+    def _open_link(self, event: tk.Event) -> None:
+        idx = self.text_widget.index(f"@{event.x},{event.y}")
+        start = self.text_widget.search("https://", idx, backwards=True, stopindex="1.0", regexp=True)
+        if start:
+            end = self.text_widget.search(r"\s", start, stopindex=tk.END, regexp=True) or tk.END
+            url = self.text_widget.get(start, end)
+            webbrowser.open(url)
+
+    # ------------------------------------------------------------------
+    # autosave & file I/O
+    # ------------------------------------------------------------------
+    def save(self) -> None:
+        """Hand a snapshot to the writer thread if the buffer changed since the last save."""
+        if self.saver is None:
+            return  # journaled storage: edits are appended as they happen
+        if not self.loader.done:
+            return  # never write a partially loaded memo
+        if not self.text_widget.edit_modified():
+            self.saver.stats.skipped_unmodified += 1
+            return
+        self.text_widget.edit_modified(False)
+        # "end-1c": the widget always ends with a newline that is not part of the memo
+        self.saver.submit(self.text_widget.get("1.0", "end-1c"))
+
+    def _load_text(self) -> None:
+        """Stream the memo into the widget: first chunk now, the rest on idle callbacks."""
+        self._replayed = 0
+        if journal_has_records(self.journal_path):
+            # a journal left over from journaled storage is replayed in either mode
+            content, self._replayed = read_memo(self.path, self.journal_path)
+            chunks = iter_text_chunks(content)
+        else:
+            chunks = iter_file_chunks(self.path)
+        self.text_widget.edit_modified(False)
+        self.loader = ChunkedLoader(self.text_widget, chunks, self._insert_loaded, self._on_load_finished)
+        self.loader.start()
+
+    def _insert_loaded(self, chunk: str) -> None:
+        """Append a loaded chunk without counting it as an edit; decorate it once visible."""
+        first_line = int(self.text_widget.index("end-1c").split(".")[0])
+        modified = self.text_widget.edit_modified()
+        with self.decorator.ignoring_edits():
+            self.text_widget.insert("end", chunk)
+        self.text_widget.edit_modified(modified)
+        self.decorator.defer_lines(first_line, int(self.text_widget.index("end-1c").split(".")[0]))
+        self.decorate_visible()
+
+    def _on_load_finished(self) -> None:
+        self.search_index.start_build()
+        # edits typed while loading (and replayed journal records) are not on disk yet
+        unsaved = bool(self._replayed) or self.text_widget.edit_modified()
+        if self.journal is not None:
+            self.journal.start(self.edit_tracker, self.text_widget, unsaved)
+            self.text_widget.edit_modified(False)
+        else:
+            self.text_widget.edit_modified(unsaved)
+
+    def decorate_visible(self, *_args) -> None:
+        """Decorate deferred lines that are currently on screen (also the yscrollcommand)."""
+        top = self.text_widget.index("@0,0")
+        bottom = self.text_widget.index(f"@0,{self.text_widget.winfo_height()}")
+        self.decorator.decorate_range(int(top.split(".")[0]), int(bottom.split(".")[0]))
+
+    # ------------------------------------------------------------------
+    # teardown
+    # ------------------------------------------------------------------
+    def close(self, wait: bool = True) -> None:
+        """Save, stop the writer and every pending callback, then drop the buffer.
+
+        With wait=False the final snapshot is only handed to the writer thread,
+        which finishes it on its own; use join() to wait for it later.
+        A page still streaming in is loaded to the end first, so edits typed
+        during the load are saved together with the rest of the file.
+        """
+        self.loader.finish()
+        self.save()
+        if self.saver is not None:
+            self.saver.close(wait=wait)
+        if self.journal is not None:
+            self.journal.close(wait=wait)
+        self.decorator.cancel()
+        self.search_index.close()
+        self.text_widget.destroy()
+
+    def join(self, timeout: float | None = None) -> bool:
+        """Wait for the writer thread after close(wait=False); True once it has stopped."""
+        writer = self.saver if self.saver is not None else self.journal
+        return writer.join(timeout)
+
 
 class MemoWindow(WindowBase):
-    """A memo window with autosave, checkboxes, and clickable URLs."""
+    """A memo window with named pages, autosave, checkboxes, and clickable URLs."""
 
     # ------------------------------------------------------------------
     # class‑level configuration constants
@@ -28,14 +215,28 @@ class MemoWindow(WindowBase):
     TEXT_FG: str = "#000000"
     LINK_FG: str = "blue"
     CHECKED_FG: str = "gray"
-
-    AUTOSAVE_MS: int = 5_000  # 5 s
+    SEARCH_HIT_BG: str = "#FFF59D"
+    SEARCH_CURRENT_BG: str = "#FFB74D"
+
+    AUTOSAVE_MS: int = 5_000  # 5 s
+    DECORATE_DELAY_MS: int = 150  # idle time before edited lines are re-decorated
+
+    # pages: "<name>.txt" (and "<name>.journal") per page; only recent pages stay in memory
+    PAGES_DIR: Path = Path("data/memos")
+    DEFAULT_PAGE: str = "memo"
+    MAX_OPEN_PAGES: int = 3  # the active page plus hidden buffers kept for instant switching
+    PAGE_IDLE_EVICT_MS: int = 10 * 60_000  # hidden pages unused this long are closed
+    # single-file memo from before pages existed; moved into PAGES_DIR on first start
     FILE_PATH: Path = Path("data/memo.txt")
+    JOURNAL_PATH: Path = Path("data/memo.journal")
+
+    # search: the index is built on idle callbacks after loading
+    SEARCH_DELAY_MS: int = 150  # idle time in the search box before the query runs
+    MAX_SEARCH_HIGHLIGHTS: int = 1_000
 
-    # pre‑compiled regexes
-    _URL_RE: re.Pattern[str] = re.compile(r"https?://[^\s]+")
-    _UNCHECKED_RE: re.Pattern[str] = re.compile(r"^\[ \] ", re.MULTILINE)
-    _CHECKED_RE: re.Pattern[str] = re.compile(r"^\[x\] ", re.MULTILINE)
+    # optional journaled storage: append each edit instead of rewriting the file
+    JOURNAL_ENABLED: bool = False
+    JOURNAL_COMPACT_BYTES: int = 256 * 1024
 
     # ------------------------------------------------------------------
     # construction / lifecycle
@@ -47,7 +248,7 @@ class MemoWindow(WindowBase):
         self.x_pos: int = x_pos
         self.y_pos: int = y_pos
         self.topmost_flag: bool = True
-        self.file_path: Path = self.FILE_PATH
+        self.pages_dir: Path = self.PAGES_DIR
         self.auto_save_interval: int = self.AUTOSAVE_MS
 
         super().__init__(
@@ -65,10 +266,15 @@ class MemoWindow(WindowBase):
     # window setup & teardown
     # ------------------------------------------------------------------
     def setup_window(self) -> None:  # noqa: D401
-        """Construct widgets, load text, and start autosave."""
+        """Construct widgets, open the most recent page, and start autosave."""
+        self._migrate_single_memo()
         self._build_widgets()
-        self._load_text()
-        self._decorate_text()
+        # least recently used first; the active page is always the last entry
+        self.pages: OrderedDict[str, MemoPage] = OrderedDict()
+        self.page: MemoPage | None = None
+        # evicted pages whose writer thread may still be finishing the last save
+        self._closing_pages: list[MemoPage] = []
+        self._show_page(self._initial_page_name())
 
         super().setup_window()
 
@@ -90,114 +296,249 @@ class MemoWindow(WindowBase):
         self.inner_frame = ctk.CTkFrame(self.outer_frame, fg_color=self.FG_INNER, corner_radius=0)
         self.inner_frame.pack(expand=True, fill=ctk.BOTH, padx=1, pady=1)
 
-        self.text_widget = tk.Text(
-            self.inner_frame,
-            wrap=tk.WORD,
-            bd=0,
-            bg=self.FG_INNER,
-            fg=self.TEXT_FG,
+        # page switcher: pick a page from the list, or type a new name and press Enter
+        self.page_selector = ctk.CTkComboBox(
+            self.inner_frame, values=[], command=self._on_page_selected, height=24, corner_radius=0
         )
-        self.text_widget.pack(side=tk.LEFT, expand=True, fill=tk.BOTH, padx=10, pady=10)
-
-        # tag styles
-        self.text_widget.tag_configure("link", foreground=self.LINK_FG, underline=True)
-        self.text_widget.tag_configure("checked", foreground=self.CHECKED_FG, overstrike=True)
-
-        # event bindings
-        self.text_widget.bind("<KeyRelease>", self._decorate_text)
-        self.text_widget.bind("<Button-1>", self._on_click)
-        self.text_widget.tag_bind("link", "<Double-1>", self._open_link)
+        self.page_selector.pack(side=tk.TOP, fill=tk.X, padx=10, pady=(10, 0))
+        self.page_selector.bind("<Return>", self._on_page_entered)
+
+        # search bar (Ctrl+F); packed below the switcher only while searching
+        self.search_var = tk.StringVar(self.window)
+        self.search_bar = tk.Frame(self.inner_frame, bg=self.FG_INNER)
+        self.search_entry = tk.Entry(self.search_bar, textvariable=self.search_var, relief=tk.SOLID, bd=1)
+        self.search_entry.pack(side=tk.LEFT, expand=True, fill=tk.X)
+        self.search_label = tk.Label(self.search_bar, bg=self.FG_INNER, fg=self.CHECKED_FG, width=7)
+        self.search_label.pack(side=tk.LEFT)
+        self._search_hits: list = []
+        # (page, query, index generation) the hits and highlights belong to
+        self._search_key: tuple | None = None
+        self._search_after_id = None
+        self._search_anchor = "1.0"
+
+        self.bind_search_keys(self.search_entry)
+        self.search_entry.bind("<Return>", lambda _e: self._jump_to_hit())
+        self.search_entry.bind("<Shift-Return>", lambda _e: self._jump_to_hit(backwards=True))
+        self.search_entry.bind("<Escape>", self._close_search)
+        self.search_var.trace_add("write", self._on_search_changed)
+
+    def bind_search_keys(self, widget: tk.Widget) -> None:
+        widget.bind("<Control-f>", self._open_search)
+        widget.bind("<F3>", lambda _e: self._jump_to_hit())
+        widget.bind("<Shift-F3>", lambda _e: self._jump_to_hit(backwards=True))
 
     # ------------------------------------------------------------------
-    # text decoration helpers
+    # pages
     # ------------------------------------------------------------------
-    def _decorate_text(self, _event: tk.Event | None = None) -> None:
-        """Apply checkbox & link styling over the entire buffer."""
-        content = self.text_widget.get("1.0", tk.END)
-
-        # clear previous tags
-        self.text_widget.tag_remove("link", "1.0", tk.END)
-        self.text_widget.tag_remove("checked", "1.0", tk.END)
-
-        self._apply_checkboxes(content)
-        self._apply_links(content)
-
-    def _apply_checkboxes(self, content: str) -> None:
-        """Replace markdown [ ] / [x] with unicode boxes & add strike."""
-        for m in self._UNCHECKED_RE.finditer(content):
-            self._replace_span(m.start(), 3, "☐")
-
-        for m in self._CHECKED_RE.finditer(content):
-            self._replace_span(m.start(), 3, "☑")
-
-        # add strike for checked lines
-        pos = "1.0"
-        while True:
-            pos = self.text_widget.search("☑", pos, stopindex=tk.END)
-            if not pos:
-                break
-            line_end = self.text_widget.index(f"{pos} lineend")
-            self.text_widget.tag_add("checked", f"{pos} + 2c", line_end)
-            pos = line_end
-
-    def _apply_links(self, content: str) -> None:
-        for m in self._URL_RE.finditer(content):
-            self.text_widget.tag_add("link", f"1.0+{m.start()}c", f"1.0+{m.end()}c")
+    def _migrate_single_memo(self) -> None:
+        """Move the pre-pages memo (and its journal) into PAGES_DIR as the default page."""
+        if self.pages_dir.exists():
+            return
+        self.pages_dir.mkdir(parents=True)
+        for old, suffix in ((self.FILE_PATH, ".txt"), (self.JOURNAL_PATH, ".journal")):
+            if old.exists():
+                os.replace(old, self.pages_dir / f"{self.DEFAULT_PAGE}{suffix}")
+
+    def _page_names(self) -> list[str]:
+        on_disk = {p.stem for p in self.pages_dir.glob("*.txt")} | {p.stem for p in self.pages_dir.glob("*.journal")}
+        return sorted(on_disk | set(self.pages))
+
+    def _initial_page_name(self) -> str:
+        """The most recently written page, so the memo reopens where it was left.
+
+        Journaled pages only rewrite "<name>.txt" when they compact, so the
+        journal's mtime counts as well.
+        """
+        latest: dict[str, float] = {}
+        for path in [*self.pages_dir.glob("*.txt"), *self.pages_dir.glob("*.journal")]:
+            latest[path.stem] = max(latest.get(path.stem, 0.0), path.stat().st_mtime)
+        if not latest:
+            return self.DEFAULT_PAGE
+        return max(latest, key=latest.__getitem__)
+
+    def _on_page_selected(self, name: str) -> None:
+        self._show_page(name)
+
+    def _find_page_name(self, name: str) -> str | None:
+        """The existing page *name* refers to; file names are case-insensitive on Windows."""
+        key = name.casefold()
+        for existing in self._page_names():
+            if existing.casefold() == key:
+                return existing
+        return None
+
+    def _on_page_entered(self, _event: tk.Event | None = None) -> str:
+        """Switch to the typed page name, creating the page if it does not exist yet."""
+        name = self.page_selector.get().strip()
+        if not PAGE_NAME_RE.fullmatch(name):
+            self.page_selector.set(self.page.name)
+            return "break"
+        existing = self._find_page_name(name)
+        if existing is None:
+            # an empty file lists the new page right away, even before it is edited;
+            # "x" never truncates a file that appeared under another spelling
+            try:
+                with open(self.pages_dir / f"{name}.txt", "x", encoding="utf-8"):
+                    pass
+            except FileExistsError:
+                existing = self._find_page_name(name)
+            except OSError as e:
+                print(f"Cannot create memo page {name!r}: {e}")
+                self.page_selector.set(self.page.name)
+                return "break"
+        self._show_page(existing or name)
+        return "break"
+
+    def _show_page(self, name: str) -> None:
+        """Make *name* the active page, reusing its buffer if it is still open."""
+        previous = self.page
+        if previous is not None:
+            if previous.name == name:
+                return
+            self._clear_search_tags()
+            previous.save()
+            previous.text_widget.pack_forget()
+
+        page = self.pages.pop(name, None)
+        if page is None:
+            page = MemoPage(self, name)
+        self.pages[name] = page
+        page.touch()
+        page.text_widget.pack(side=tk.LEFT, expand=True, fill=tk.BOTH, padx=10, pady=10)
+        page.text_widget.focus_set()
+        self.page = page
+
+        self.page_selector.configure(values=self._page_names())
+        self.page_selector.set(name)
+        self._evict_pages()
+        if self.search_bar.winfo_ismapped():
+            self._search_anchor = "1.0"
+            self._on_search_changed()
+
+    def _evict_pages(self) -> None:
+        """Close hidden pages beyond MAX_OPEN_PAGES or unused for PAGE_IDLE_EVICT_MS."""
+        now = time.monotonic()
+        for name, page in list(self.pages.items()):
+            if page is self.page or not page.loader.done:
+                continue  # never drop the visible page or one still streaming in
+            idle = now - page.last_used > self.PAGE_IDLE_EVICT_MS / 1000
+            if len(self.pages) > self.MAX_OPEN_PAGES or idle:
+                del self.pages[name]
+                # don't block the Tk thread on the writer; shutdown() waits for it
+                page.close(wait=False)
+                self._closing_pages.append(page)
 
     # ------------------------------------------------------------------
-    # click / URL handling
+    # search
     # ------------------------------------------------------------------
-    def _on_click(self, event: tk.Event) -> None:
-        idx = self.text_widget.index(f"@{event.x},{event.y}")
-        line_start = f"{idx.split('.')[0]}.0"
-        line_text = self.text_widget.get(line_start, f"{line_start} lineend")
-
-        if line_text.startswith("☐ "):
-            self._toggle_checkbox(line_start, "☐ ", "☑ ")
-        elif line_text.startswith("☑ "):
-            self._toggle_checkbox(line_start, "☑ ", "☐ ")
-
-        self._decorate_text()
-
-    def _toggle_checkbox(self, line_start: str, old: str, new: str) -> None:
-        self.text_widget.delete(line_start, f"{line_start}+{len(old)}c")
-        self.text_widget.insert(line_start, new)
-
-    def _open_link(self, event: tk.Event) -> None:
-        idx = self.text_widget.index(f"@{event.x},{event.y}")
-        start = self.text_widget.search("https://", idx, backwards=True, stopindex="1.0", regexp=True)
-        if start:
-            end = self.text_widget.search(r"\s", start, stopindex=tk.END, regexp=True) or tk.END
-            url = self.text_widget.get(start, end)
-            webbrowser.open(url)
+    def _open_search(self, _event: tk.Event | None = None) -> str:
+        if not self.search_bar.winfo_ismapped():
+            # incremental matches are searched from where the cursor was when the bar opened
+            self._search_anchor = self.page.text_widget.index(tk.INSERT)
+            self.search_bar.pack(side=tk.TOP, fill=tk.X, padx=10, pady=(10, 0), after=self.page_selector)
+        self.search_entry.focus_set()
+        self.search_entry.select_range(0, tk.END)
+        return "break"
+
+    def _close_search(self, _event: tk.Event | None = None) -> str:
+        self.search_bar.pack_forget()
+        self._clear_search_tags()
+        self._search_hits = []
+        self.page.text_widget.focus_set()
+        return "break"
+
+    def _on_search_changed(self, *_args) -> None:
+        """Run the query once typing in the search box pauses."""
+        if self._search_after_id is not None:
+            self.window.after_cancel(self._search_after_id)
+        self._search_after_id = self.window.after(self.SEARCH_DELAY_MS, self._search_from_anchor)
+
+    def _search_from_anchor(self) -> None:
+        self._search_after_id = None
+        self.page.text_widget.mark_set(tk.INSERT, self._search_anchor)
+        self._jump_to_hit()
+
+    def _run_search(self) -> None:
+        """Query the index and highlight the hits, unless the query and the page are unchanged.
+
+        The index generation changes with every edit, so cached hit positions are never stale.
+        """
+        page = self.page
+        key = (page, self.search_var.get(), page.search_index.generation)
+        if key == self._search_key:
+            return
+        text = page.text_widget
+        self._search_hits = page.search_index.search(self.search_var.get())
+        self._clear_search_tags()
+        self._search_key = key
+        for line, start, end in self._search_hits[: self.MAX_SEARCH_HIGHLIGHTS]:
+            text.tag_add("search_hit", f"{line}.{start}", f"{line}.{end}")
+        self.search_label.configure(text=str(len(self._search_hits)) if self.search_var.get().strip() else "")
+
+    def _jump_to_hit(self, backwards: bool = False) -> str:
+        """Select the next (or previous) hit after the insert cursor, wrapping around."""
+        self._run_search()
+        hits = self._search_hits
+        if not hits:
+            return "break"
+
+        text = self.page.text_widget
+        line, col = (int(part) for part in text.index(tk.INSERT).split("."))
+        i = bisect.bisect_left(hits, (line, col))
+        i = (i - 1 if backwards else i) % len(hits)
+        line, start, end = hits[i]
+
+        first, last = f"{line}.{start}", f"{line}.{end}"
+        text.tag_remove("search_current", "1.0", tk.END)
+        text.tag_add("search_current", first, last)
+        # leave the cursor after a forward hit so the next search moves on
+        text.mark_set(tk.INSERT, first if backwards else last)
+        text.see(first)
+        self.search_label.configure(text=f"{i + 1}/{len(hits)}")
+        return "break"
+
+    def _clear_search_tags(self) -> None:
+        self._search_key = None
+        self.page.text_widget.tag_remove("search_hit", "1.0", tk.END)
+        self.page.text_widget.tag_remove("search_current", "1.0", tk.END)
 
     # ------------------------------------------------------------------
-    # autosave & file I/O
+    # autosave
     # ------------------------------------------------------------------
     def _schedule_autosave(self) -> None:
-        self._save_text()
+        for page in self.pages.values():
+            page.save()
+        self._evict_pages()
+        still_closing = []
+        for page in self._closing_pages:
+            if page.join(0):
+                self._report_page(page)
+            else:
+                still_closing.append(page)
+        self._closing_pages = still_closing
         self.window.after(self.auto_save_interval, self._schedule_autosave)
 
-    def _save_text(self) -> None:
-        self.file_path.parent.mkdir(parents=True, exist_ok=True)
-        self.file_path.write_text(self.text_widget.get("1.0", tk.END), encoding="utf-8")
-
-    def _load_text(self) -> None:
-        if self.file_path.exists():
-            self.text_widget.insert("1.0", self.file_path.read_text(encoding="utf-8"))
-
-    # ------------------------------------------------------------------
-    # utility
-    # ------------------------------------------------------------------
-    def _replace_span(self, start_offset: int, length: int, replacement: str) -> None:
-        self.text_widget.delete(f"1.0+{start_offset}c", f"1.0+{start_offset + length}c")
-        self.text_widget.insert(f"1.0+{start_offset}c", replacement)
-
     # ------------------------------------------------------------------
     # graceful shutdown
     # ------------------------------------------------------------------
+    def shutdown(self) -> None:
+        """Flush and close every open page; the writer threads are daemons and die with the process."""
+        for page in self.pages.values():
+            page.close()
+            self._report_page(page)
+        self.pages.clear()
+        for page in self._closing_pages:
+            page.join(timeout=5.0)
+            self._report_page(page)
+        self._closing_pages.clear()
+
+    def _report_page(self, page: MemoPage) -> None:
+        """Print a closed page's statistics when profiling (DESKTOP_MASCOT_IMPORTTIME)."""
+        if PROFILING:
+            print(f"Memo page {page.report()}")
+
     def _on_close(self) -> None:
-        self._save_text()
+        self.shutdown()
         self.window.destroy()
 
     # ------------------------------------------------------------------
@@ -208,3 +549,6 @@ class MemoWindow(WindowBase):
 
     def update(self, event):  # noqa: D401
         super().update(event)
+        if event == Event.EXIT_APPLICATION:
+            # the application exits through root.destroy(), which never runs WM_DELETE_WINDOW
+            self.shutdown()
@@ -0,0 +1,76 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+import tkinter as tk
+from typing import Any, Callable, Iterable, List, Tuple
+
+
+class AssetLoader:
+    """画像の読み込み・加工をスレッドプールで行い、結果を Tk スレッドへ渡す
+
+    ワーカーでは PIL の処理だけを行い、PhotoImage の生成やキャンバス操作は
+    ``on_ready`` コールバック（Tk スレッドで after から呼ばれる）で行うこと。
+    """
+
+    POLL_MS = 10
+
+    def __init__(self, root: tk.Misc, max_workers: int | None = None) -> None:
+        self.root = root
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="asset-loader")
+        # (まとめて待つ Future, すべて終わったら結果のリストで呼ぶコールバック)
+        self._pending: List[Tuple[List[Future], Callable[[List[Any]], None]]] = []
+        self._idle_callbacks: List[Callable[[], None]] = []
+        self._poll_id: str | None = None
+
+    def submit(self, fn: Callable[..., Any], *args: Any, on_ready: Callable[[Any], None]) -> Future:
+        """*fn(*args)* をワーカーで実行し、完了後に Tk スレッドで *on_ready(結果)* を呼ぶ"""
+        future = self._executor.submit(fn, *args)
+        self._pending.append(([future], lambda results: on_ready(results[0])))
+        self._schedule_poll()
+        return future
+
+    def submit_many(
+        self, fn: Callable[[Any], Any], items: Iterable[Any], on_ready: Callable[[List[Any]], None]
+    ) -> List[Future]:
+        """*items* の要素ごとに *fn(要素)* を別々のワーカーで実行する
+
+        すべて終わったら Tk スレッドで *on_ready(結果のリスト)* を呼ぶ（結果は *items* と同じ順）。
+        """
+        futures = [self._executor.submit(fn, item) for item in items]
+        self._pending.append((futures, on_ready))
+        self._schedule_poll()
+        return futures
+
+    def when_idle(self, callback: Callable[[], None]) -> None:
+        """投入済みの処理がすべて受け渡されたら *callback* を呼ぶ"""
+        self._idle_callbacks.append(callback)
+        self._schedule_poll()
+
+    def shutdown(self) -> None:
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _schedule_poll(self) -> None:
+        if self._poll_id is None:
+            self._poll_id = self.root.after(self.POLL_MS, self._poll)
+
+    def _poll(self) -> None:
+        self._poll_id = None
+        done, pending = [], []
+        for item in self._pending:
+            (done if all(future.done() for future in item[0]) else pending).append(item)
+        self._pending = pending
+
+        for futures, on_ready in done:
+            try:
+                on_ready([future.result() for future in futures])
+            except Exception as e:
+                print(f"Failed to load asset: {e}")
+
+        if self._pending:
+            self._schedule_poll()
+            return
+
+        callbacks, self._idle_callbacks = self._idle_callbacks, []
+        for callback in callbacks:
+            callback()
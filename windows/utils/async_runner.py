@@ -0,0 +1,55 @@
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Coroutine
+
+
+class AsyncRunner:
+    """専用スレッドで asyncio のイベントループを回し、Tk スレッドからコルーチンを投入する
+
+    Tk の mainloop はメインスレッドのまま動かし、通信などの待ちはこのループ側で行う。
+    ブロッキングする処理は ``asyncio.to_thread`` でループのスレッドプールに渡すので、
+    周期処理のたびにスレッドを作ることはない。結果を画面に出すときは
+    UiDispatcher を経由して Tk スレッドに戻すこと。
+    """
+
+    def __init__(self, name: str = "async-runner") -> None:
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def start(self) -> None:
+        if not self._thread.is_alive():
+            self._thread.start()
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> concurrent.futures.Future:
+        """*coro* をループ上のタスクとして実行する（どのスレッドから呼んでもよい）
+
+        返り値の Future を ``cancel()`` すると、ループ上のタスクもキャンセルされる。
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """残っているタスクをキャンセルしてループを止める"""
+        if not self._thread.is_alive():
+            return
+        self.loop.call_soon_threadsafe(self._cancel_all)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.run_until_complete(self.loop.shutdown_default_executor())
+            self.loop.close()
+
+    def _cancel_all(self) -> None:
+        tasks = asyncio.all_tasks(self.loop)
+        for task in tasks:
+            task.cancel()
+
+        async def wait_and_stop():
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.loop.stop()
+
+        self.loop.create_task(wait_and_stop())
@@ -0,0 +1,140 @@
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """一時ファイルに書いて fsync してから置き換える（途中で落ちても元のファイルは壊れない）"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    if os.name == "posix":
+        # rename 自体もディスクに残るよう、ディレクトリも同期する
+        fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+@dataclass
+class SaveStats:
+    """自動保存の集計"""
+
+    saves: int = 0
+    skipped_unmodified: int = 0  # 変更フラグが立っていなかった
+    skipped_unchanged: int = 0  # 変更はあったが保存済みの内容と同じだった
+    coalesced: int = 0  # 書き込み待ちのうちに新しいスナップショットで置き換えられた
+    bytes_written: int = 0
+    total_write_sec: float = 0.0
+    max_write_sec: float = 0.0
+    last_write_sec: float = 0.0
+
+    def record(self, size: int, write_sec: float) -> None:
+        self.saves += 1
+        self.bytes_written += size
+        self.total_write_sec += write_sec
+        self.last_write_sec = write_sec
+        self.max_write_sec = max(self.max_write_sec, write_sec)
+
+    def report(self) -> str:
+        mean = self.total_write_sec / self.saves * 1000 if self.saves else 0.0
+        return (
+            f"saves={self.saves} bytes={self.bytes_written} "
+            f"skipped={self.skipped_unmodified}+{self.skipped_unchanged} coalesced={self.coalesced} "
+            f"write mean={mean:.1f}ms max={self.max_write_sec * 1000:.1f}ms"
+        )
+
+
+class BackgroundSaver:
+    """受け取ったテキストを専用スレッドでファイルに書き出す
+
+    書き込み待ちは常に最新の 1 つだけで、書いている間に届いた分は
+    まとめて次の 1 回になる。前回書いた内容とハッシュが同じなら書かない。
+    """
+
+    def __init__(self, path: Path, name: str = "autosave") -> None:
+        self.path = path
+        self.stats = SaveStats()
+        self._pending: Optional[str] = None
+        self._last_digest: Optional[bytes] = None
+        self._busy = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, text: str) -> None:
+        """*text* の保存を依頼する（すぐ戻る）"""
+        with self._cond:
+            if self._pending is not None:
+                self.stats.coalesced += 1
+            self._pending = text
+            self._cond.notify()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """依頼済みの保存が終わるまで待つ。間に合えば True"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending is not None or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 5.0, wait: bool = True) -> None:
+        """残りを書き終えてからスレッドを止める
+
+        wait=False なら止める指示だけして戻る（残りはスレッドが書き終えてから止まる）。
+        """
+        if wait:
+            self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if wait:
+            self._thread.join(timeout)
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """スレッドが止まるまで待つ。止まっていれば True"""
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._pending is None:
+                    return
+                text, self._pending = self._pending, None
+                self._busy = True
+
+            try:
+                self._save(text)
+            except OSError as e:
+                print(f"Failed to save {self.path}: {e}")
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def _save(self, text: str) -> None:
+        data = text.encode("utf-8")
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if digest == self._last_digest:
+            self.stats.skipped_unchanged += 1
+            return
+        started = time.perf_counter()
+        write_atomic(self.path, data)
+        self.stats.record(len(data), time.perf_counter() - started)
+        self._last_digest = digest
@@ -0,0 +1,74 @@
+from collections import OrderedDict
+from typing import Tuple
+
+from PIL import Image, ImageColor, ImageDraw, ImageTk
+
+
+def render_balloon(
+    width: int,
+    height: int,
+    body_width: int,
+    color: str,
+    radius: int = 10,
+    tail_size: int = 10,
+    supersample: int = 4,
+) -> Image.Image:
+    """角丸の本体と右側のしっぽからなる吹き出しを RGBA 画像で描く
+
+    *supersample* 倍の大きさで描いてから縮小し、輪郭をなめらかにする。
+    しっぽの高さは従来の描画と同じく min(height / 2, 40)。
+    """
+    s = supersample
+    fill = ImageColor.getrgb(color) + (255,)
+    canvas = Image.new("RGBA", (width * s, height * s), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(canvas)
+    draw.rounded_rectangle((0, 0, body_width * s - 1, height * s - 1), radius=radius * s, fill=fill)
+
+    tail_y = min(height / 2, 40)
+    draw.polygon(
+        [
+            ((body_width - 1) * s, (tail_y - 5) * s),
+            ((body_width + tail_size) * s, tail_y * s),
+            ((body_width - 1) * s, (tail_y + 5) * s),
+        ],
+        fill=fill,
+    )
+    return canvas.reduce(s)
+
+
+class BalloonCache:
+    """吹き出し画像を (幅, 高さ) ごとに作り置きする LRU
+
+    高さは bucket ピクセル単位に切り上げるので、高さが少し違うだけの
+    投稿同士で同じ画像を使い回せる。PhotoImage を作るので Tk スレッドから使う。
+    """
+
+    def __init__(self, body_width: int, color: str, bucket: int = 8, max_entries: int = 16) -> None:
+        self.body_width = body_width
+        self.color = color
+        self.bucket = bucket
+        self.max_entries = max_entries
+        self._images: "OrderedDict[Tuple[int, int], ImageTk.PhotoImage]" = OrderedDict()
+
+        # 統計
+        self.hits = 0
+        self.renders = 0
+
+    def bucket_height(self, height: int) -> int:
+        return -(-int(height) // self.bucket) * self.bucket
+
+    def get(self, width: int, height: int) -> ImageTk.PhotoImage:
+        """*width* x *height*（高さは切り上げ済みであること）の吹き出し画像を返す"""
+        key = (width, height)
+        photo = self._images.get(key)
+        if photo is not None:
+            self._images.move_to_end(key)
+            self.hits += 1
+            return photo
+
+        photo = ImageTk.PhotoImage(render_balloon(width, height, self.body_width, self.color))
+        self.renders += 1
+        self._images[key] = photo
+        while len(self._images) > self.max_entries:
+            self._images.popitem(last=False)
+        return photo
@@ -0,0 +1,31 @@
+from typing import Tuple
+
+from PIL import Image, ImageChops
+
+
+def _band_mask(band: Image.Image, ref: int, tolerance: int) -> Image.Image:
+    """|値 - ref| <= tolerance のピクセルを 255、それ以外を 0 にしたマスク"""
+    return band.point([255 if abs(v - ref) <= tolerance else 0 for v in range(256)])
+
+
+def make_background_fully_transparent(
+    image: Image.Image, color: Tuple[int, int, int], tolerance: int
+) -> Image.Image:
+    """指定色に近いピクセルを透明な白に、半透明ピクセルを完全透明にする
+
+    ピクセル単位の Python ループを使わず、PIL のバンド演算で 1 パスに処理する。
+    旧実装（getdata/putdata + getpixel/putpixel）と同じ結果を返す。
+    """
+    r, g, b, a = image.convert("RGBA").split()
+
+    # 3 チャンネルすべてが許容範囲内 → キー色
+    key = ImageChops.multiply(_band_mask(r, color[0], tolerance), _band_mask(g, color[1], tolerance))
+    key = ImageChops.multiply(key, _band_mask(b, color[2], tolerance))
+
+    # 不透明かつキー色でないピクセルだけ alpha=255、それ以外は 0
+    opaque = a.point([255 if v == 255 else 0 for v in range(256)])
+    alpha = ImageChops.subtract(opaque, key)
+
+    # キー色のピクセルは (255, 255, 255, 0) に
+    r, g, b = (ImageChops.lighter(band, key) for band in (r, g, b))
+    return Image.merge("RGBA", (r, g, b, alpha))
@@ -0,0 +1,86 @@
+import queue
+import time
+import tkinter as tk
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+@dataclass
+class DispatchStats:
+    """キューの深さと、積まれてから実行されるまでの待ち時間の集計"""
+
+    delivered: int = 0
+    max_depth: int = 0
+    total_wait_sec: float = 0.0
+    max_wait_sec: float = 0.0
+    last_wait_sec: float = 0.0
+
+    def record(self, wait_sec: float) -> None:
+        self.delivered += 1
+        self.total_wait_sec += wait_sec
+        self.last_wait_sec = wait_sec
+        self.max_wait_sec = max(self.max_wait_sec, wait_sec)
+
+    def report(self, depth: int) -> str:
+        mean = self.total_wait_sec / self.delivered * 1000 if self.delivered else 0.0
+        return (
+            f"depth={depth} max_depth={self.max_depth} delivered={self.delivered} "
+            f"wait mean={mean:.1f}ms max={self.max_wait_sec * 1000:.1f}ms"
+        )
+
+
+class UiDispatcher:
+    """ワーカースレッドから Tk スレッドへ処理を渡すキュー
+
+    ``post`` はどのスレッドから呼んでもよい。積まれた処理は Tk スレッドで
+    ``after`` による短い周期で取り出して実行する。
+    """
+
+    POLL_MS = 50
+
+    def __init__(self, widget: tk.Misc) -> None:
+        self.widget = widget
+        self.stats = DispatchStats()
+        self._queue: "queue.SimpleQueue[tuple[Callable[..., Any], tuple[Any, ...], float]]" = queue.SimpleQueue()
+        self._poll_id: str | None = None
+        self._stopped = False  # stop() が呼ばれた（実行中の処理の中からでも）
+
+    @property
+    def depth(self) -> int:
+        """まだ実行されていない処理の数"""
+        return self._queue.qsize()
+
+    def report(self) -> str:
+        return self.stats.report(self.depth)
+
+    def start(self) -> None:
+        self._stopped = False
+        if self._poll_id is None:
+            self._poll_id = self.widget.after(self.POLL_MS, self._drain)
+
+    def stop(self) -> None:
+        self._stopped = True
+        if self._poll_id is not None:
+            self.widget.after_cancel(self._poll_id)
+            self._poll_id = None
+
+    def post(self, callback: Callable[..., Any], *args: Any) -> None:
+        """*callback(*args)* を Tk スレッドで実行するよう予約（スレッドセーフ）"""
+        self._queue.put((callback, args, time.perf_counter()))
+        self.stats.max_depth = max(self.stats.max_depth, self._queue.qsize())
+
+    def _drain(self) -> None:
+        self._poll_id = None
+        # ウィンドウを閉じる処理などで stop() されたら、残りは実行せず次も予約しない
+        while not self._stopped:
+            try:
+                callback, args, enqueued_at = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            self.stats.record(time.perf_counter() - enqueued_at)
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"UI callback failed: {e}")
+        if not self._stopped and self._poll_id is None:
+            self._poll_id = self.widget.after(self.POLL_MS, self._drain)
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import time
+import tkinter as tk
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from PIL import Image, ImageChops, ImageTk
+
+
+@dataclass
+class FrameStats:
+    """フレーム切り替えにかかった Tk 呼び出し回数と時間の集計"""
+
+    frames: int = 0
+    tk_calls: int = 0
+    total_sec: float = 0.0
+    last_sec: float = 0.0
+    max_sec: float = 0.0
+
+    def record(self, tk_calls: int, elapsed: float) -> None:
+        self.frames += 1
+        self.tk_calls += tk_calls
+        self.total_sec += elapsed
+        self.last_sec = elapsed
+        self.max_sec = max(self.max_sec, elapsed)
+
+    def report(self) -> str:
+        if not self.frames:
+            return "frames=0"
+        return (
+            f"frames={self.frames} tk_calls/frame={self.tk_calls / self.frames:.1f} "
+            f"mean={self.total_sec / self.frames * 1000:.3f}ms max={self.max_sec * 1000:.3f}ms"
+        )
+
+
+class FrameRing:
+    """1 つの Canvas アイテムの image を差し替えてアニメーションさせる
+
+    フレームごとにアイテムを作って表示/非表示を切り替える代わりに、
+    アイテムは 1 つだけ持ち、表示するフレームが変わったときだけ
+    ``itemconfig(image=...)`` を 1 回呼ぶ。
+    """
+
+    def __init__(
+        self,
+        canvas: tk.Canvas,
+        frames: Sequence[ImageTk.PhotoImage],
+        x: int = 0,
+        y: int = 0,
+        anchor: str = tk.NW,
+    ) -> None:
+        if not frames:
+            raise ValueError("FrameRing needs at least one frame")
+        self.canvas = canvas
+        self.frames: List[ImageTk.PhotoImage] = list(frames)
+        self.item: int = canvas.create_image(x, y, image=self.frames[0], anchor=anchor)
+        self.current_index = 0
+        self.stats = FrameStats()
+
+        self._timer: Optional[str] = None
+        self._sequence: List[int] = []
+        self._times: List[float] = []
+        self._on_done: Optional[Callable[[], None]] = None
+
+    # ------------------------------------------------------------------ #
+    # フレーム表示
+    # ------------------------------------------------------------------ #
+    def show(self, index: int) -> None:
+        """フレーム *index* を表示（同じフレームなら何もしない）"""
+        if index == self.current_index:
+            return
+        start = time.perf_counter()
+        tk_calls = self._render(index)
+        self.stats.record(tk_calls, time.perf_counter() - start)
+        self.current_index = index
+
+    def _render(self, index: int) -> int:
+        """フレームを描画し、発行した Tk 呼び出し回数を返す"""
+        self.canvas.itemconfig(self.item, image=self.frames[index])
+        return 1
+
+    # ------------------------------------------------------------------ #
+    # シーケンス再生（after ベース）
+    # ------------------------------------------------------------------ #
+    def play(
+        self,
+        sequence: Sequence[int],
+        times: Sequence[float],
+        on_done: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """フレーム番号 *sequence* を、それぞれ *times* 秒ずつ表示する"""
+        if len(sequence) != len(times):
+            raise ValueError("sequence and times must have the same length")
+        self.cancel()
+        self._sequence = list(sequence)
+        self._times = list(times)
+        self._on_done = on_done
+        self._step(0)
+
+    def cancel(self) -> None:
+        """再生中のシーケンスを止める"""
+        if self._timer is not None:
+            self.canvas.after_cancel(self._timer)
+            self._timer = None
+
+    def _step(self, position: int) -> None:
+        if position >= len(self._sequence):
+            self._timer = None
+            if self._on_done:
+                self._on_done()
+            return
+
+        self.show(self._sequence[position])
+        delay_ms = int(self._times[position] * 1000)
+        self._timer = self.canvas.after(delay_ms, self._step, position + 1)
+
+
+def diff_bbox(base: Image.Image, frames: Sequence[Image.Image]) -> Optional[Tuple[int, int, int, int]]:
+    """*frames* が *base* と異なる領域をすべて含む最小の矩形（差分がなければ None）"""
+    box: Optional[Tuple[int, int, int, int]] = None
+    for frame in frames:
+        if frame.size != base.size:
+            raise ValueError(f"frame size {frame.size} does not match base size {base.size}")
+        frame_box = ImageChops.difference(base.convert("RGBA"), frame.convert("RGBA")).getbbox(alpha_only=False)
+        if frame_box is None:
+            continue
+        if box is None:
+            box = frame_box
+        else:
+            box = (
+                min(box[0], frame_box[0]),
+                min(box[1], frame_box[1]),
+                max(box[2], frame_box[2]),
+                max(box[3], frame_box[3]),
+            )
+    return box
+
+
+class DeltaFrameRing(FrameRing):
+    """ベース画像 1 枚 + 差分パッチでフレームを切り替える FrameRing
+
+    読み込み時に各フレームがベースと異なる矩形（まばたきなら目の周り）を求め、
+    その部分だけを切り出した PhotoImage を持つ。再生時はベースの PhotoImage に
+    パッチを ``copy`` するだけなので、Tk の再描画も差分領域に限られる。
+    """
+
+    def __init__(
+        self,
+        canvas: tk.Canvas,
+        images: Sequence[Image.Image],
+        x: int = 0,
+        y: int = 0,
+        anchor: str = tk.NW,
+    ) -> None:
+        if not images:
+            raise ValueError("DeltaFrameRing needs at least one frame")
+        base = images[0]
+        self.box = diff_bbox(base, images[1:])
+        self.base_image = ImageTk.PhotoImage(base)
+        # フレーム 0 のパッチはベースへ戻すときに使う
+        self.patches: List[ImageTk.PhotoImage] = (
+            [ImageTk.PhotoImage(image.crop(self.box)) for image in images] if self.box else []
+        )
+        super().__init__(canvas, [self.base_image], x, y, anchor)
+
+    @property
+    def photo_bytes(self) -> int:
+        """保持している PhotoImage の画素データ量（RGBA 換算）"""
+        photos = [self.base_image] + self.patches
+        return sum(photo.width() * photo.height() * 4 for photo in photos)
+
+    def _render(self, index: int) -> int:
+        if self.box is None:
+            return 0
+        self.canvas.tk.call(
+            str(self.base_image),
+            "copy",
+            str(self.patches[index]),
+            "-to",
+            self.box[0],
+            self.box[1],
+            "-compositingrule",
+            "set",
+        )
+        return 1
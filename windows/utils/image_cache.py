@@ -0,0 +1,206 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Hashable, Mapping, Optional
+
+from PIL import Image
+
+
+@dataclass
+class CacheStats:
+    """キャッシュのヒット・ミス数"""
+
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0  # ディスク: 304 で再利用できた回数
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def report(self) -> str:
+        return (
+            f"hits={self.hits} misses={self.misses} revalidated={self.revalidated} "
+            f"evictions={self.evictions} hit_rate={self.hit_rate:.0%}"
+        )
+
+
+class MemoryImageCache:
+    """デコード・縮小済み画像の LRU（合計バイト数で上限を決める）"""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Hashable, Image.Image]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Image.Image]:
+        with self._lock:
+            image = self._entries.get(key)
+            if image is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return image
+
+    def put(self, key: Hashable, image: Image.Image) -> None:
+        size = self._image_bytes(image)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= self._image_bytes(old)
+            self._entries[key] = image
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= self._image_bytes(evicted)
+                self.stats.evictions += 1
+
+    @staticmethod
+    def _image_bytes(image: Image.Image) -> int:
+        return image.width * image.height * len(image.getbands())
+
+
+@dataclass
+class DiskEntry:
+    """ディスクキャッシュの 1 エントリ"""
+
+    data: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires: float  # この時刻（epoch 秒）までは再検証なしで使える
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires
+
+    def validators(self) -> Dict[str, str]:
+        """条件付きリクエスト用のヘッダー"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class DiskImageCache:
+    """ダウンロードした画像の生バイトを保存するディスクキャッシュ
+
+    鮮度は Cache-Control: max-age（なければ Expires）で判断し、期限切れの
+    エントリは ETag / Last-Modified を使った条件付きリクエストで再検証する。
+    合計サイズが上限を超えたら、最後に使った時刻（mtime）が古い順に削除する。
+    """
+
+    _MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+    def __init__(self, directory: Path = Path("data/image_cache"), max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[DiskEntry]:
+        data_path, meta_path = self._paths(url)
+        with self._lock:
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+                data = data_path.read_bytes()
+            except (OSError, ValueError):
+                self.stats.misses += 1
+                return None
+            os.utime(data_path)  # LRU 用に最終使用時刻を更新
+        entry = DiskEntry(data, meta.get("etag"), meta.get("last_modified"), meta.get("expires", 0.0))
+        if entry.fresh:
+            self.stats.hits += 1
+        else:
+            self.stats.misses += 1  # 期限切れ（再検証が必要）もミスとして数える
+        return entry
+
+    def put(self, url: str, data: bytes, headers: Mapping[str, str]) -> None:
+        data_path, meta_path = self._paths(url)
+        meta = {
+            "url": url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "expires": self._expires(headers),
+        }
+        with self._lock:
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                self._write_atomic(data_path, data)
+                self._write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+                self._evict()
+            except OSError as e:
+                print(f"Failed to write image cache for {url}: {e}")
+
+    def revalidated(self, url: str, headers: Mapping[str, str]) -> None:
+        """304 Not Modified を受けたときに期限を延ばす"""
+        _, meta_path = self._paths(url)
+        with self._lock:
+            self.stats.revalidated += 1
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+                meta["expires"] = self._expires(headers)
+                meta["etag"] = headers.get("ETag", meta.get("etag"))
+                self._write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+            except (OSError, ValueError) as e:
+                print(f"Failed to update image cache for {url}: {e}")
+
+    def discard(self, url: str) -> None:
+        """壊れていた画像などのエントリを消す"""
+        data_path, meta_path = self._paths(url)
+        with self._lock:
+            data_path.unlink(missing_ok=True)
+            meta_path.unlink(missing_ok=True)
+
+    def _paths(self, url: str):
+        name = hashlib.sha256(url.encode("utf-8")).hexdigest()[:40]
+        return self.directory / f"{name}.bin", self.directory / f"{name}.json"
+
+    def _expires(self, headers: Mapping[str, str]) -> float:
+        match = self._MAX_AGE_RE.search(headers.get("Cache-Control", ""))
+        if match:
+            return time.time() + int(match.group(1))
+        expires = headers.get("Expires")
+        if expires:
+            try:
+                return parsedate_to_datetime(expires).timestamp()
+            except (TypeError, ValueError):
+                pass
+        return 0.0
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def _evict(self) -> None:
+        files = [(p, p.stat()) for p in self.directory.glob("*.bin")]
+        total = sum(st.st_size for _, st in files)
+        for data_path, st in sorted(files, key=lambda f: f[1].st_mtime):
+            if total <= self.max_bytes:
+                break
+            data_path.unlink(missing_ok=True)
+            data_path.with_suffix(".json").unlink(missing_ok=True)
+            total -= st.st_size
+            self.stats.evictions += 1
+
+
+#: アプリ全体で共有するキャッシュ
+memory_cache = MemoryImageCache()
+disk_cache = DiskImageCache()
@@ -0,0 +1,221 @@
+import re
+import time
+import tkinter as tk
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+
+from .text_edits import TextEdit, TextEditTracker
+
+URL_RE = re.compile(r"https?://[^\s]+")
+#: 行頭の Markdown 風チェックボックスと、置き換え先の記号
+CHECKBOX_MARKUP = (("[ ] ", "☐"), ("[x] ", "☑"))
+CHECKED_MARK = "☑"
+
+
+class DirtyLines:
+    """再装飾が必要な行番号の集合
+
+    挿入・削除で行が増減したら、記録済みの行番号も合わせてずらす。
+    """
+
+    def __init__(self) -> None:
+        self.lines: Set[int] = set()
+        self.all = False
+
+    def __bool__(self) -> bool:
+        return self.all or bool(self.lines)
+
+    def apply(self, edit: TextEdit) -> None:
+        if edit.kind == "reset":
+            self.all = True
+            return
+
+        first = edit.start[0]
+        if edit.kind == "insert":
+            added = edit.line_delta
+            if added:
+                self.lines = {line + added if line > first else line for line in self.lines}
+            self.lines.update(range(first, first + added + 1))
+        else:
+            last = edit.end[0]
+            removed = last - first
+            if removed:
+                self.lines = {
+                    line - removed if line > last else line
+                    for line in self.lines
+                    if not first < line <= last
+                }
+            self.lines.add(first)
+
+    def mark_all(self) -> None:
+        self.all = True
+
+    def take(self) -> Tuple[bool, List[int]]:
+        """(全行か, 行番号の昇順リスト) を返して空にする"""
+        result = (self.all, sorted(self.lines))
+        self.lines = set()
+        self.all = False
+        return result
+
+
+class MemoDecorator:
+    """メモのチェックボックスとリンクの装飾を、編集された行だけに行う
+
+    編集のたびに行番号を記録しておき、入力が delay_ms 途切れたところで
+    まとめて 1 回だけ再装飾する。全行を見直すのは decorate_all だけ。
+    装飾のための置き換え（"[ ] " → "☐ " など）は再び汚れ扱いにしない。
+
+    読み込んだばかりの行は defer_lines で「後回し」にしておき、画面に
+    入ったときに decorate_range で装飾する。
+    """
+
+    def __init__(self, text: tk.Text, tracker: TextEditTracker, delay_ms: int = 150) -> None:
+        self.text = text
+        self.delay_ms = delay_ms
+        self.dirty = DirtyLines()
+        self._deferred: List[Tuple[int, int]] = []  # 後回しにしている行の範囲（両端を含む）
+        self._applying = False
+        self._after_id: Optional[str] = None
+        tracker.add_listener(self._on_edit)
+
+        # 統計
+        self.passes = 0
+        self.lines_decorated = 0
+        self.last_pass_ms = 0.0
+
+    def report(self) -> str:
+        deferred = sum(last - first + 1 for first, last in self._deferred)
+        return (
+            f"passes={self.passes} lines={self.lines_decorated} deferred={deferred} "
+            f"last={self.last_pass_ms:.1f}ms"
+        )
+
+    @contextmanager
+    def ignoring_edits(self) -> Iterator[None]:
+        """この中で行った変更は汚れとして記録しない（読み込みなど）"""
+        applying, self._applying = self._applying, True
+        try:
+            yield
+        finally:
+            self._applying = applying
+
+    def defer_lines(self, first: int, last: int) -> None:
+        """*first*〜*last* 行の装飾を、画面に入るまで後回しにする"""
+        if self._deferred and self._deferred[-1][1] >= first - 1:
+            start, end = self._deferred[-1]
+            self._deferred[-1] = (min(start, first), max(end, last))
+        else:
+            self._deferred.append((first, last))
+
+    def decorate_range(self, first: int, last: int) -> None:
+        """*first*〜*last* 行のうち、後回しにしていた行を今すぐ装飾する"""
+        lines: List[int] = []
+        keep: List[Tuple[int, int]] = []
+        for start, end in self._deferred:
+            if end < first or start > last:
+                keep.append((start, end))
+                continue
+            lo, hi = max(start, first), min(end, last)
+            lines.extend(range(lo, hi + 1))
+            if start < lo:
+                keep.append((start, lo - 1))
+            if hi < end:
+                keep.append((hi + 1, end))
+        if lines:
+            self._deferred = keep
+            self.decorate_lines(lines)
+
+    def decorate_all(self) -> None:
+        """全行を装飾し直す"""
+        self._deferred = []
+        self.dirty.mark_all()
+        self.flush()
+
+    def decorate_lines(self, lines: Iterable[int]) -> None:
+        """指定した行だけを今すぐ装飾する"""
+        self.dirty.lines.update(lines)
+        self.flush()
+
+    def flush(self) -> None:
+        """たまっている行を今すぐ装飾する"""
+        if self._after_id is not None:
+            self.text.after_cancel(self._after_id)
+            self._after_id = None
+        if not self.dirty:
+            return
+
+        started = time.perf_counter()
+        all_lines, lines = self.dirty.take()
+        last_line = int(self.text.index("end - 1 chars").split(".")[0])
+        targets = range(1, last_line + 1) if all_lines else [line for line in lines if line <= last_line]
+
+        with self.ignoring_edits():
+            for line in targets:
+                self._decorate_line(line)
+
+        self.passes += 1
+        self.lines_decorated += len(targets)
+        self.last_pass_ms = (time.perf_counter() - started) * 1000
+
+    def cancel(self) -> None:
+        """待っている再装飾を取り消す（Text を破棄する前に呼ぶ）"""
+        if self._after_id is not None:
+            self.text.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _on_edit(self, edit: TextEdit) -> None:
+        if self._applying:
+            return
+        self._shift_deferred(edit)
+        self.dirty.apply(edit)
+        if self._after_id is not None:
+            self.text.after_cancel(self._after_id)
+        self._after_id = self.text.after(self.delay_ms, self.flush)
+
+    def _shift_deferred(self, edit: TextEdit) -> None:
+        """行の増減に合わせて、後回しにしている範囲をずらす"""
+        if not self._deferred or edit.kind == "reset":
+            return
+        first = edit.start[0]
+        if edit.kind == "insert":
+            added = edit.line_delta
+            if added:
+                self._deferred = [
+                    (start + added, end + added) if start > first else (start, end + added if end >= first else end)
+                    for start, end in self._deferred
+                ]
+            return
+
+        last = edit.end[0]
+        removed = last - first
+        if not removed:
+            return
+
+        def moved(line: int) -> int:
+            if line <= first:
+                return line
+            return first if line <= last else line - removed
+
+        shifted = [(moved(start), moved(end)) for start, end in self._deferred]
+        self._deferred = [(start, end) for start, end in shifted if start <= end]
+
+    def _decorate_line(self, line: int) -> None:
+        start, end = f"{line}.0", f"{line}.end"
+        content = self.text.get(start, end)
+
+        for markup, box in CHECKBOX_MARKUP:
+            if content.startswith(markup):
+                # 後ろの空白は残し、"[ ]" の 3 文字だけを記号 1 文字に置き換える
+                self.text.delete(start, f"{line}.3")
+                self.text.insert(start, box)
+                content = box + content[3:]
+                break
+
+        self.text.tag_remove("link", start, end)
+        self.text.tag_remove("checked", start, end)
+
+        checked = content.find(CHECKED_MARK)
+        if checked >= 0:
+            self.text.tag_add("checked", f"{line}.{checked + 2}", end)
+        for m in URL_RE.finditer(content):
+            self.text.tag_add("link", f"{line}.{m.start()}", f"{line}.{m.end()}")
@@ -0,0 +1,287 @@
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+import tkinter as tk
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+from .autosave import write_atomic
+from .text_edits import TextEdit, TextEditTracker
+
+JOURNAL_VERSION = 1
+_CLOSE = object()
+
+
+def snapshot_digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class LineBuffer:
+    """行のリストで持つテキスト。ジャーナルの記録（行・列での挿入・削除）を適用する"""
+
+    def __init__(self, text: str) -> None:
+        self.lines = text.split("\n")
+
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+    def apply(self, record: List[Any]) -> None:
+        kind, line, col, text = record
+        if kind == "i":
+            self.insert(line, col, text)
+        elif kind == "d":
+            self.delete(line, col, text)
+        else:
+            raise ValueError(f"unknown journal record {kind!r}")
+
+    def insert(self, line: int, col: int, text: str) -> None:
+        current = self.lines[line - 1]
+        if col > len(current):
+            raise ValueError("insert past end of line")
+        self.lines[line - 1 : line] = (current[:col] + text + current[col:]).split("\n")
+
+    def delete(self, line: int, col: int, text: str) -> None:
+        parts = text.split("\n")
+        last = line - 1 + len(parts) - 1
+        end_col = col + len(text) if len(parts) == 1 else len(parts[-1])
+        removed = "\n".join(self.lines[line - 1 : last + 1])[col:]
+        if not removed.startswith(text):
+            raise ValueError("deleted text does not match the buffer")
+        self.lines[line - 1 : last + 1] = [self.lines[line - 1][:col] + self.lines[last][end_col:]]
+
+
+def journal_has_records(journal_path: Path) -> bool:
+    """ヘッダーのほかに記録が 1 行でもあるか（なければスナップショットだけ読めばよい）"""
+    try:
+        with open(journal_path, encoding="utf-8") as f:
+            f.readline()
+            return bool(f.readline())
+    except (OSError, ValueError):
+        return False
+
+
+def read_memo(snapshot_path: Path, journal_path: Path) -> Tuple[str, int]:
+    """スナップショットにジャーナルを適用した内容と、適用した記録の数を返す
+
+    ジャーナルの先頭に記録したスナップショットのハッシュが今のスナップショットと
+    違えば（圧縮の途中で落ちたなど）、ジャーナルはすでに反映済みとして無視する。
+    途中で壊れている行があれば、その手前までを適用する。
+    """
+    try:
+        data = snapshot_path.read_bytes()
+    except FileNotFoundError:
+        data = b""
+    snapshot = data.decode("utf-8")
+
+    try:
+        with open(journal_path, encoding="utf-8") as f:
+            header = json.loads(f.readline() or "null")
+            if not header or header.get("base") != snapshot_digest(data):
+                return snapshot, 0
+            buffer = LineBuffer(snapshot)
+            applied = 0
+            for line in f:
+                try:
+                    buffer.apply(json.loads(line))
+                except (ValueError, IndexError, TypeError) as e:
+                    print(f"Stopped replaying {journal_path} at record {applied + 1}: {e}")
+                    break
+                applied += 1
+    except (FileNotFoundError, ValueError, AttributeError):
+        return snapshot, 0
+    return buffer.text(), applied
+
+
+@dataclass
+class JournalStats:
+    records: int = 0
+    bytes_appended: int = 0
+    batches: int = 0
+    compactions: int = 0
+    last_compaction_sec: float = 0.0
+
+    def report(self) -> str:
+        return (
+            f"records={self.records} bytes={self.bytes_appended} batches={self.batches} "
+            f"compactions={self.compactions} last_compaction={self.last_compaction_sec * 1000:.1f}ms"
+        )
+
+
+class MemoJournal:
+    """メモの編集を追記型のジャーナルに記録する保存方式
+
+    Text への挿入・削除をそのまま 1 行の JSON として追記するので、保存の
+    コストは文書の大きさではなく編集の大きさで決まる。書き込みは専用スレッドで
+    batch_sec ごとにまとめて fsync する。ジャーナルが compact_bytes を超えたら、
+    同じスレッドが手元の LineBuffer から新しいスナップショットを書いて
+    ジャーナルを空にする。
+
+    LineBuffer には fsync まで済んだ記録だけを反映する。書き込みに失敗したら
+    それ以降の記録は捨て、Tk スレッドが次の機会（次の編集か close）に
+    Text の全文を "reset" として送り、スナップショットから書き直す。
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Path,
+        journal_path: Path,
+        compact_bytes: int = 256 * 1024,
+        batch_sec: float = 0.5,
+    ) -> None:
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path
+        self.compact_bytes = compact_bytes
+        self.batch_sec = batch_sec
+        self.stats = JournalStats()
+
+        self._text: Optional[tk.Text] = None
+        self._buffer = LineBuffer("")
+        self._file = None
+        self._journal_bytes = 0
+        self._resync_requested = False  # 書き込みスレッドが立て、Tk スレッドが全文を送って下ろす
+        self._discarding = False  # 全文が届くまで個々の記録を捨てる（書き込みスレッドだけが触る）
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="memo-journal", daemon=True)
+
+    def start(self, tracker: TextEditTracker, text: tk.Text, replayed: int) -> None:
+        """読み込み済みの *text* を起点に記録を始める（読み込みの挿入は記録しない）"""
+        self._text = text
+        self._buffer = LineBuffer(text.get("1.0", "end - 1 chars"))
+        if replayed or not self._open_journal():
+            self._queue.put(("compact",))
+        tracker.add_listener(self._on_edit)
+        self._thread.start()
+
+    def close(self, timeout: float = 5.0, wait: bool = True) -> None:
+        """残りの記録を書き出してスレッドを止める
+
+        wait=False なら止める指示だけして戻る（Tk スレッドを止めたくない場合）。
+        """
+        if self._thread.is_alive():
+            self._send_reset_if_requested()
+            self._queue.put(_CLOSE)
+            if wait:
+                self._thread.join(timeout)
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """スレッドが止まるまで待つ。止まっていれば（始まっていなければ）True"""
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    # ------------------------------------------------------------------
+    # Tk スレッド側
+    # ------------------------------------------------------------------
+    def _on_edit(self, edit: TextEdit) -> None:
+        if self._send_reset_if_requested():
+            return  # この編集も全文に含まれている
+        if edit.kind == "insert":
+            self._queue.put(["i", edit.start[0], edit.start[1], edit.text])
+        elif edit.kind == "delete":
+            self._queue.put(["d", edit.start[0], edit.start[1], edit.text])
+        else:
+            self._queue.put(("reset", self._text.get("1.0", "end - 1 chars")))
+
+    def _send_reset_if_requested(self) -> bool:
+        if not self._resync_requested:
+            return False
+        self._resync_requested = False
+        self._queue.put(("reset", self._text.get("1.0", "end - 1 chars")))
+        return True
+
+    # ------------------------------------------------------------------
+    # 書き込みスレッド側
+    # ------------------------------------------------------------------
+    def _open_journal(self) -> bool:
+        """今のスナップショットに対応するジャーナルがあれば追記用に開く"""
+        try:
+            with open(self.journal_path, encoding="utf-8") as f:
+                header = json.loads(f.readline() or "null")
+            base = snapshot_digest(self.snapshot_path.read_bytes())
+        except (OSError, ValueError):
+            return False
+        if not header or header.get("base") != base:
+            return False
+        self._file = open(self.journal_path, "a", encoding="utf-8", newline="\n")
+        self._journal_bytes = self.journal_path.stat().st_size
+        return True
+
+    def _run(self) -> None:
+        closing = False
+        while not closing:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.batch_sec
+            while batch[-1] is not _CLOSE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            closing = batch[-1] is _CLOSE
+            try:
+                self._write_batch([item for item in batch if item is not _CLOSE])
+            except (OSError, ValueError, IndexError) as e:
+                print(f"Memo journal write failed: {e}")
+                # ディスクと LineBuffer のどちらももう信用できないので、全文から書き直す
+                self._discarding = True
+                self._resync_requested = True
+        if self._file is not None:
+            self._file.close()
+
+    def _write_batch(self, batch: List[Any]) -> None:
+        records: List[Any] = []
+        compact = False
+        for item in batch:
+            if isinstance(item, tuple):
+                if item[0] == "reset":
+                    # 全文にはそれまでの記録も含まれている
+                    self._buffer = LineBuffer(item[1])
+                    self._discarding = False
+                    records = []
+                compact = True
+            elif not self._discarding:
+                records.append(item)
+
+        if compact or self._file is None:
+            # スナップショットごと書き直すので、失敗してもディスク上は前の状態のまま
+            for record in records:
+                self._buffer.apply(record)
+            self._compact()
+            return
+        if records:
+            chunk = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+            self._file.write(chunk)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            for record in records:
+                self._buffer.apply(record)
+            size = len(chunk.encode("utf-8"))
+            self._journal_bytes += size
+            self.stats.records += len(records)
+            self.stats.bytes_appended += size
+            self.stats.batches += 1
+        if self._journal_bytes > self.compact_bytes:
+            self._compact()
+
+    def _compact(self) -> None:
+        """今の内容をスナップショットとして書き、ジャーナルを空にする"""
+        started = time.perf_counter()
+        data = self._buffer.text().encode("utf-8")
+        write_atomic(self.snapshot_path, data)
+        header = json.dumps({"v": JOURNAL_VERSION, "base": snapshot_digest(data)}) + "\n"
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass  # 書き込みに失敗したあとのファイル。この直後に置き換える
+        write_atomic(self.journal_path, header.encode("utf-8"))
+        self._file = open(self.journal_path, "a", encoding="utf-8", newline="\n")
+        self._journal_bytes = len(header)
+        self.stats.compactions += 1
+        self.stats.last_compaction_sec = time.perf_counter() - started
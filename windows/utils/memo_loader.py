@@ -0,0 +1,123 @@
+import time
+import tkinter as tk
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+CHUNK_CHARS = 64 * 1024
+
+
+def iter_file_chunks(path: Path, chunk_chars: int = CHUNK_CHARS) -> Iterator[str]:
+    """*path* を先頭から *chunk_chars* 文字ずつ読む（ファイルがなければ何も返さない）"""
+    try:
+        f = open(path, encoding="utf-8")
+    except FileNotFoundError:
+        return
+    with f:
+        while True:
+            chunk = f.read(chunk_chars)
+            if not chunk:
+                return
+            yield chunk
+
+
+def iter_text_chunks(text: str, chunk_chars: int = CHUNK_CHARS) -> Iterator[str]:
+    for start in range(0, len(text), chunk_chars):
+        yield text[start : start + chunk_chars]
+
+
+@dataclass
+class LoadStats:
+    chunks: int = 0
+    chars: int = 0
+    slices: int = 0
+    first_slice_sec: float = 0.0
+    max_slice_sec: float = 0.0
+    total_sec: float = 0.0
+
+    def report(self) -> str:
+        return (
+            f"chars={self.chars} chunks={self.chunks} slices={self.slices} "
+            f"first={self.first_slice_sec * 1000:.1f}ms max_slice={self.max_slice_sec * 1000:.1f}ms "
+            f"total={self.total_sec * 1000:.0f}ms"
+        )
+
+
+class ChunkedLoader:
+    """大きなテキストを少しずつ Text に流し込む
+
+    最初の 1 かたまりは start() の中ですぐに入れ（最初の 1 画面分が表示できる）、
+    残りはアイドル時のコールバックごとに slice_budget_ms を超えない範囲で入れる。
+    その間もイベント処理は止まらないので、ウィンドウの移動や入力ができる。
+    挿入そのものは *insert* に任せる（装飾やジャーナルの扱いは呼び出し側で決める）。
+    """
+
+    def __init__(
+        self,
+        widget: tk.Misc,
+        chunks: Iterator[str],
+        insert: Callable[[str], None],
+        on_done: Callable[[], None],
+        slice_budget_ms: float = 8.0,
+    ) -> None:
+        self.widget = widget
+        self.stats = LoadStats()
+        self._chunks = chunks
+        self._insert = insert
+        self._on_done = on_done
+        self._budget = slice_budget_ms / 1000
+        self._started = 0.0
+        self._after_id: Optional[str] = None
+        self.done = False
+
+    def start(self) -> None:
+        self._started = time.perf_counter()
+        self._step(first=True)
+
+    def cancel(self) -> None:
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def finish(self) -> None:
+        """残りをすべて今すぐ入れる（読み込み途中で閉じるときに、全体を保存できるように）"""
+        if self.done:
+            return
+        self.cancel()
+        for chunk in self._chunks:
+            self._insert_chunk(chunk)
+        self._complete()
+
+    def _insert_chunk(self, chunk: str) -> None:
+        self._insert(chunk)
+        self.stats.chunks += 1
+        self.stats.chars += len(chunk)
+
+    def _complete(self) -> None:
+        self.done = True
+        self.stats.total_sec = time.perf_counter() - self._started
+        self._on_done()
+
+    def _step(self, first: bool = False) -> None:
+        self._after_id = None
+        began = time.perf_counter()
+        finished = False
+        while True:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                finished = True
+                break
+            self._insert_chunk(chunk)
+            if first or time.perf_counter() - began >= self._budget:
+                break
+
+        elapsed = time.perf_counter() - began
+        self.stats.slices += 1
+        self.stats.max_slice_sec = max(self.stats.max_slice_sec, elapsed)
+        if first:
+            self.stats.first_slice_sec = elapsed
+
+        if finished:
+            self._complete()
+        else:
+            self._after_id = self.widget.after_idle(self._step)
@@ -0,0 +1,274 @@
+import itertools
+import re
+import time
+import tkinter as tk
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from .memo_decorator import DirtyLines
+from .text_edits import TextEdit, TextEditTracker
+
+Hit = Tuple[int, int, int]  # (行, 開始列, 終了列)
+
+_WORD_RE = re.compile(r"[^\W぀-ヿ㐀-鿿豈-﫿ｦ-ﾟ]+")
+_CJK_RE = re.compile(r"[぀-ヿ㐀-鿿豈-﫿ｦ-ﾟ]+")
+
+
+def tokenize(text: str) -> Set[str]:
+    """行を索引語に分ける
+
+    英数字などは単語（小文字）、かな・漢字は 1 文字と 2 文字の組 (bigram) にする。
+    """
+    tokens = {word.lower() for word in _WORD_RE.findall(text)}
+    for run in _CJK_RE.findall(text):
+        tokens.update(run)
+        tokens.update(run[i : i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def query_terms(query: str) -> Tuple[List[str], List[str]]:
+    """検索語を (部分一致で探す単語, そのまま引く索引語) に分ける"""
+    words = [word.lower() for word in _WORD_RE.findall(query)]
+    grams: List[str] = []
+    for run in _CJK_RE.findall(query):
+        grams.extend([run] if len(run) == 1 else [run[i : i + 2] for i in range(len(run) - 1)])
+    return words, grams
+
+
+class MemoSearchIndex:
+    """メモの行の転置索引
+
+    行には番号とは別に変わらない ID を振り、索引は ID で持つ。行の増減は
+    line_ids の差し込み・削除だけで済み、変わった行の読み直しはアイドル時
+    （または検索の直前）にまとめて行う。索引は行の文字列も ID ごとに持つので、
+    検索で候補行を確かめるときに Text へ問い合わせない。
+
+    検索は大文字・小文字を区別しない単純な部分一致で、単語の途中にも一致する。
+    索引は候補行を絞るためだけに使う。検索語の英単語はそれを含む索引語すべて、
+    かな・漢字は bigram（1 文字なら unigram）で候補行を集め、最後に実際の行の
+    文字列で一致位置を確かめる。
+
+    最初の索引作りは start_build から始まり、アイドル時に slice_budget_ms ずつ進む。
+    作り終える前に検索された場合、まだの部分は 1 回の get でまとめて読み、
+    同じ部分一致で探すので、索引の進み具合で結果は変わらない。
+
+    generation は内容が変わるたびに増えるので、検索結果のキャッシュの鍵に使える。
+    """
+
+    def __init__(
+        self,
+        text: tk.Text,
+        tracker: TextEditTracker,
+        delay_ms: int = 300,
+        slice_budget_ms: float = 8.0,
+        build_batch_lines: int = 2000,
+    ) -> None:
+        self.text = text
+        self.delay_ms = delay_ms
+        self.slice_budget = slice_budget_ms / 1000
+        self.build_batch_lines = build_batch_lines
+
+        self.line_ids: List[int] = []
+        self._ids = itertools.count()
+        self._text_of: Dict[int, str] = {}
+        self._postings: Dict[str, Set[int]] = defaultdict(set)
+        self._line_of: Optional[Dict[int, int]] = None
+
+        self.active = False
+        self.build_cursor: Optional[int] = None  # 索引作りでこの行以降はまだ
+        self.dirty = DirtyLines()
+        self.generation = 0
+        self._after_id: Optional[str] = None
+        tracker.add_listener(self._on_edit)
+
+        # 統計
+        self.queries = 0
+        self.last_query_ms = 0.0
+        self.build_sec = 0.0
+
+    def report(self) -> str:
+        state = "building" if self.build_cursor is not None else "ready"
+        return (
+            f"{state} lines={len(self.line_ids)} tokens={len(self._postings)} "
+            f"queries={self.queries} last_query={self.last_query_ms:.1f}ms build={self.build_sec * 1000:.0f}ms"
+        )
+
+    # ------------------------------------------------------------------
+    # 索引作り
+    # ------------------------------------------------------------------
+    def start_build(self) -> None:
+        """いまの内容で索引を作り直す（アイドル時に少しずつ進む）"""
+        self._cancel()
+        last_line = int(self.text.index("end - 1 chars").split(".")[0])
+        self.line_ids = [next(self._ids) for _ in range(last_line)]
+        self._text_of.clear()
+        self._postings.clear()
+        self._line_of = None
+        self.dirty = DirtyLines()
+        self.build_cursor = 1
+        self.build_sec = 0.0
+        self.generation += 1
+        self.active = True
+        self._after_id = self.text.after_idle(self._build_step)
+
+    def _build_step(self) -> None:
+        self._after_id = None
+        began = time.perf_counter()
+        last_line = len(self.line_ids)
+        # 1 回の処理で少なくとも 1 かたまりは進める
+        while self.build_cursor is not None:
+            first = self.build_cursor
+            last = min(last_line, first + self.build_batch_lines - 1)
+            lines = self.text.get(f"{first}.0", f"{last}.end").split("\n")
+            for offset, content in enumerate(lines):
+                self._reindex(self.line_ids[first - 1 + offset], content)
+            self.build_cursor = last + 1 if last < last_line else None
+            if time.perf_counter() - began >= self.slice_budget:
+                break
+        self.build_sec += time.perf_counter() - began
+
+        if self.build_cursor is not None:
+            self._after_id = self.text.after_idle(self._build_step)
+        elif self.dirty:
+            self._schedule_flush()
+
+    # ------------------------------------------------------------------
+    # 編集の反映
+    # ------------------------------------------------------------------
+    def _on_edit(self, edit: TextEdit) -> None:
+        self.generation += 1
+        if not self.active:
+            return
+        if edit.kind == "reset":
+            self.start_build()
+            return
+
+        first = edit.start[0]
+        delta = edit.line_delta
+        if delta > 0:
+            self.line_ids[first:first] = [next(self._ids) for _ in range(delta)]
+        elif delta < 0:
+            for line_id in self.line_ids[first : first - delta]:
+                self._drop(line_id)
+            del self.line_ids[first : first - delta]
+        if delta:
+            self._line_of = None
+
+        cursor = self.build_cursor
+        if cursor is None or first < cursor:
+            self.dirty.apply(edit)
+        if cursor is not None and first < cursor:
+            # まだ索引にしていない行の位置もずらす（末尾まで消されたら索引作りは終わり）
+            cursor = max(first + 1, cursor + delta)
+            self.build_cursor = cursor if cursor <= len(self.line_ids) else None
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._after_id is None:
+            self._after_id = self.text.after(self.delay_ms, self._flush_step)
+
+    def _flush_step(self) -> None:
+        self._after_id = None
+        self.flush()
+        if self.build_cursor is not None:
+            self._after_id = self.text.after_idle(self._build_step)
+
+    def flush(self) -> None:
+        """編集された行を読み直す"""
+        _, lines = self.dirty.take()
+        last_line = len(self.line_ids)
+        for line in lines:
+            if line <= last_line and (self.build_cursor is None or line < self.build_cursor):
+                self._reindex(self.line_ids[line - 1], self.text.get(f"{line}.0", f"{line}.end"))
+
+    def _reindex(self, line_id: int, content: str) -> None:
+        old_content = self._text_of.get(line_id)
+        if old_content == content:
+            return
+        tokens = tokenize(content)
+        old = tokenize(old_content) if old_content is not None else set()
+        for token in old - tokens:
+            ids = self._postings.get(token)
+            if ids is not None:
+                ids.discard(line_id)
+                if not ids:
+                    del self._postings[token]
+        for token in tokens - old:
+            self._postings[token].add(line_id)
+        self._text_of[line_id] = content
+
+    def _drop(self, line_id: int) -> None:
+        content = self._text_of.pop(line_id, None)
+        for token in tokenize(content) if content is not None else ():
+            ids = self._postings.get(token)
+            if ids is not None:
+                ids.discard(line_id)
+                if not ids:
+                    del self._postings[token]
+
+    def close(self) -> None:
+        """予約しているアイドル処理を取り消す（Text を破棄する前に呼ぶ）"""
+        self.active = False
+        self._cancel()
+
+    def _cancel(self) -> None:
+        if self._after_id is not None:
+            self.text.after_cancel(self._after_id)
+            self._after_id = None
+
+    # ------------------------------------------------------------------
+    # 検索
+    # ------------------------------------------------------------------
+    def search(self, query: str) -> List[Hit]:
+        """*query* を部分一致で含む位置を先頭から順に返す（大文字・小文字は区別しない）"""
+        query = query.strip()
+        if not query or not self.active:
+            return []
+        started = time.perf_counter()
+        self.flush()
+
+        candidates = self._candidates(query)
+        pattern = re.compile(re.escape(query), re.IGNORECASE)
+        line_of = self._lines_by_id()
+        text_of = self._text_of
+        hits: List[Hit] = []
+        for line, line_id in sorted([(line_of[line_id], line_id) for line_id in candidates if line_id in line_of]):
+            for match in pattern.finditer(text_of[line_id]):
+                hits.append((line, *match.span()))
+        if self.build_cursor is not None:
+            hits.extend(self._search_unindexed(pattern, self.build_cursor))
+
+        self.queries += 1
+        self.last_query_ms = (time.perf_counter() - started) * 1000
+        return hits
+
+    def _candidates(self, query: str) -> Set[int]:
+        words, grams = query_terms(query)
+        if not words and not grams:
+            # 記号だけの検索語は索引で絞れないので、索引済みの全行を確かめる
+            return set(self._text_of)
+        result: Optional[Set[int]] = None
+        for gram in grams:
+            ids = self._postings.get(gram, set())
+            result = set(ids) if result is None else result & ids
+        for word in words:
+            # 行の中の一致部分は必ずどれかの単語の一部なので、word を含む索引語を集めれば漏れない
+            matched: Set[int] = set()
+            for token, ids in self._postings.items():
+                if word in token:
+                    matched |= ids
+            result = matched if result is None else result & matched
+        return result or set()
+
+    def _lines_by_id(self) -> Dict[int, int]:
+        if self._line_of is None:
+            self._line_of = {line_id: line for line, line_id in enumerate(self.line_ids, start=1)}
+        return self._line_of
+
+    def _search_unindexed(self, pattern: "re.Pattern[str]", first_line: int) -> List[Hit]:
+        """索引がまだの行をまとめて読んで探す（Tk の呼び出しは 1 回）"""
+        rest = self.text.get(f"{first_line}.0", "end - 1 chars")
+        hits: List[Hit] = []
+        for line, content in enumerate(rest.split("\n"), start=first_line):
+            hits.extend((line, m.start(), m.end()) for m in pattern.finditer(content))
+        return hits
@@ -0,0 +1,76 @@
+import threading
+from typing import Mapping, NamedTuple, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+#: 接続・読み込みのタイムアウト（秒）
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 15
+#: 画像 1 枚あたりのダウンロード上限
+MAX_IMAGE_BYTES = 10 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+class DownloadRejected(requests.exceptions.RequestException):
+    """サイズ超過や想定外の Content-Type でダウンロードを打ち切った"""
+
+
+class Download(NamedTuple):
+    status_code: int
+    headers: Mapping[str, str]
+    content: bytes
+
+
+def get_session() -> requests.Session:
+    """Keep-Alive で接続を使い回す共有セッション"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def download(
+    url: str,
+    headers: Optional[Mapping[str, str]] = None,
+    max_bytes: int = MAX_IMAGE_BYTES,
+    content_type_prefix: Optional[str] = "image/",
+) -> Download:
+    """*url* をストリーミングで取得する
+
+    - 接続・読み込みにタイムアウトを付ける
+    - Content-Type が *content_type_prefix* で始まらなければ本文を読まずに打ち切る
+    - Content-Length または実際の受信量が *max_bytes* を超えたら打ち切る
+    - 304 Not Modified は本文なしでそのまま返す
+    """
+    with get_session().get(
+        url, headers=headers, stream=True, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)
+    ) as response:
+        if response.status_code == 304:
+            return Download(response.status_code, response.headers, b"")
+        response.raise_for_status()
+
+        content_type = response.headers.get("Content-Type", "")
+        if content_type_prefix and not content_type.startswith(content_type_prefix):
+            raise DownloadRejected(f"unexpected content type {content_type!r} for {url}")
+
+        content_length = response.headers.get("Content-Length")
+        if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+            raise DownloadRejected(f"{url} is {content_length} bytes (limit {max_bytes})")
+
+        chunks = []
+        received = 0
+        for chunk in response.iter_content(CHUNK_SIZE):
+            received += len(chunk)
+            if received > max_bytes:
+                raise DownloadRejected(f"{url} exceeded {max_bytes} bytes")
+            chunks.append(chunk)
+        return Download(response.status_code, response.headers, b"".join(chunks))
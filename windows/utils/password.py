@@ -1,5 +1,8 @@
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, InvalidToken
 import json
+import os
+
+SESSION_PATH = "data/session.bin"
 
 
 # キーの生成と保存（初回のみ実行）
@@ -46,3 +49,30 @@ def load_credentials():
         encrypted_password = credentials["password"].encode()
         password = decrypt_password(encrypted_password)
         return username, password
+
+
+# セッション文字列の保存（暗号化して credentials.json と同じ場所へ）
+def save_session(session_string):
+    encrypted_session = Fernet(load_key()).encrypt(session_string.encode())
+    tmp_path = f"{SESSION_PATH}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(encrypted_session)
+    os.replace(tmp_path, SESSION_PATH)
+
+
+# セッション文字列の読み込み（保存されていない・復号できない場合は None）
+def load_session():
+    if not os.path.exists(SESSION_PATH):
+        return None
+    with open(SESSION_PATH, "rb") as file:
+        encrypted_session = file.read()
+    try:
+        return Fernet(load_key()).decrypt(encrypted_session).decode()
+    except InvalidToken:
+        return None
+
+
+# 保存済みセッションの削除
+def delete_session():
+    if os.path.exists(SESSION_PATH):
+        os.remove(SESSION_PATH)
@@ -0,0 +1,174 @@
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Optional, TypeVar
+
+T = TypeVar("T")
+
+HOUR_SEC = 3600.0
+
+
+class PollDeferred(Exception):
+    """バックオフ中・上限到達・別のリクエストが実行中のため、今回は送らなかった"""
+
+    def __init__(self, reason: str, retry_after: float) -> None:
+        super().__init__(f"{reason} (retry after {retry_after:.0f}s)")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class PollController:
+    """タイムライン取得リクエストの流量制御
+
+    - 同時に実行中のリクエストは常に 1 つだけ（それ以外は PollDeferred）
+    - 失敗・HTTP 429 のたびに待ち時間を指数的に伸ばす（ジッター付き）。
+      429 で Retry-After / RateLimit-Reset が返ってきたらそれ以上待つ
+    - 直近 1 時間のリクエスト数が max_requests_per_hour に達したら送らない
+
+    どのスレッドから呼んでもよい。
+    """
+
+    def __init__(
+        self,
+        max_requests_per_hour: int = 120,
+        base_backoff_sec: float = 30.0,
+        max_backoff_sec: float = 30 * 60.0,
+    ) -> None:
+        self.max_requests_per_hour = max_requests_per_hour
+        self.base_backoff_sec = base_backoff_sec
+        self.max_backoff_sec = max_backoff_sec
+
+        self.failures = 0
+        self.total_requests = 0
+        self.deferred = 0
+        self._request_times: Deque[float] = deque()
+        self._next_allowed = 0.0
+        self._in_flight = False
+        self._lock = threading.Lock()
+
+    def call(self, fn: Callable[..., T], *args: Any) -> T:
+        """許可されていれば *fn(*args)* を実行する。許可されなければ PollDeferred"""
+        with self._lock:
+            self._admit()
+            self._in_flight = True
+            self._request_times.append(time.monotonic())
+            self.total_requests += 1
+
+        try:
+            result = fn(*args)
+        except Exception as e:
+            with self._lock:
+                self._in_flight = False
+                self._on_failure(e)
+            raise
+
+        with self._lock:
+            self._in_flight = False
+            self.failures = 0
+        return result
+
+    def requests_in_last_hour(self) -> int:
+        with self._lock:
+            self._prune(time.monotonic())
+            return len(self._request_times)
+
+    def report(self) -> str:
+        return (
+            f"requests={self.total_requests} last_hour={self.requests_in_last_hour()}/"
+            f"{self.max_requests_per_hour} deferred={self.deferred} failures={self.failures}"
+        )
+
+    def _admit(self) -> None:
+        now = time.monotonic()
+        if self._in_flight:
+            self._defer("another timeline request is in flight", 0.0)
+        if now < self._next_allowed:
+            self._defer("backing off", self._next_allowed - now)
+        self._prune(now)
+        if len(self._request_times) >= self.max_requests_per_hour:
+            self._defer("hourly request budget exhausted", self._request_times[0] + HOUR_SEC - now)
+
+    def _defer(self, reason: str, retry_after: float) -> None:
+        self.deferred += 1
+        raise PollDeferred(reason, retry_after)
+
+    def _prune(self, now: float) -> None:
+        while self._request_times and now - self._request_times[0] >= HOUR_SEC:
+            self._request_times.popleft()
+
+    def _on_failure(self, error: Exception) -> None:
+        self.failures += 1
+        delay = min(self.max_backoff_sec, self.base_backoff_sec * 2 ** (self.failures - 1))
+        # equal jitter: 半分は固定、残り半分をランダムにして同時再試行を避ける
+        delay = delay / 2 + random.uniform(0, delay / 2)
+
+        status, server_delay = _rate_limit_info(error)
+        if status == 429 and server_delay is not None:
+            delay = max(delay, server_delay)
+        self._next_allowed = time.monotonic() + delay
+        print(f"Timeline request failed ({status or type(error).__name__}), backing off {delay:.0f}s")
+
+
+def _rate_limit_info(error: Exception) -> tuple[Optional[int], Optional[float]]:
+    """例外に付いているレスポンスから (ステータス, サーバー指定の待ち秒数) を取り出す"""
+    response = getattr(error, "response", None)
+    if response is None and error.args:
+        response = error.args[0]
+    status = getattr(response, "status_code", None)
+    headers = getattr(response, "headers", None) or {}
+    headers = {str(k).lower(): v for k, v in dict(headers).items()}
+
+    retry_after = headers.get("retry-after")
+    if retry_after is not None and str(retry_after).isdigit():
+        return status, float(retry_after)
+    reset = headers.get("ratelimit-reset")
+    if reset is not None and str(reset).isdigit():
+        return status, max(0.0, float(reset) - time.time())
+    return status, None
+
+
+class AdaptiveInterval:
+    """フィードの流れの速さに合わせて取得間隔を決める
+
+    取得のたびに「前回からの新着件数 / 経過秒数」を観測し、指数移動平均で
+    ならした投稿レートから、1 回の取得で target_items 件ほど新着が
+    たまる間隔を求めて [min_sec, max_sec] に収める。
+    静かなタイムラインでは間隔が伸び、にぎやかなタイムラインでは縮む。
+    """
+
+    def __init__(
+        self,
+        initial_sec: float = 120.0,
+        min_sec: float = 60.0,
+        max_sec: float = 15 * 60.0,
+        target_items: float = 5.0,
+        smoothing: float = 0.3,
+    ) -> None:
+        self.min_sec = min_sec
+        self.max_sec = max_sec
+        self.target_items = target_items
+        self.smoothing = smoothing
+        self.current = min(max(initial_sec, min_sec), max_sec)
+        self.rate: Optional[float] = None  # 1 秒あたりの新着件数（平滑化済み）
+
+    def observe(self, new_items: int, elapsed_sec: float) -> float:
+        """前回の取得から *elapsed_sec* 秒で *new_items* 件増えたことを記録し、次の間隔を返す"""
+        if elapsed_sec <= 0:
+            return self.current
+        sample = new_items / elapsed_sec
+        if self.rate is None:
+            self.rate = sample
+        else:
+            self.rate += self.smoothing * (sample - self.rate)
+
+        if self.rate <= 0:
+            interval = self.max_sec
+        else:
+            interval = self.target_items / self.rate
+        self.current = min(max(interval, self.min_sec), self.max_sec)
+        return self.current
+
+    def report(self) -> str:
+        rate = f"{self.rate * 3600:.1f}/h" if self.rate is not None else "-"
+        return f"interval={self.current:.0f}s rate={rate}"
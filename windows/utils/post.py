@@ -1,34 +1,113 @@
+from dataclasses import dataclass
 from typing import Dict, Union, List, Optional
 import requests
 from PIL import Image, ImageTk
 from io import BytesIO
 import random
 import tkinter as tk
+from .network import download
+from .image_cache import disk_cache, memory_cache
+
+
+@dataclass(frozen=True)
+class PostRender:
+    """ワーカーから Tk スレッドへ渡す「この投稿を表示して」というメッセージ
+
+    通信・解析・画像のデコードはすべて済ませた状態で作る。image は縮小済みで、
+    受け取った側は読み取りにだけ使う。
+    """
+
+    uri: str
+    cid: str
+    text: str
+    image_url: Optional[str]
+    image: Optional[Image.Image]
+    liked: bool
 
 
 def fetch_image(url: Optional[str], max_width, max_height) -> Optional[Image.Image]:
+    """画像を取得して縮小する
+
+    1) メモリ LRU（縮小済み画像）にあればそのまま返す（通信なし）
+    2) ディスクキャッシュが新鮮ならその生バイトを使う（通信なし）
+    3) 期限切れなら ETag / Last-Modified で再検証し、304 ならディスクのものを使う
+
+    取得したバイト列は、画像としてデコードできてからディスクキャッシュに入れる。
+    画像でなかったり途中で切れていたりしたら、キャッシュのエントリも消して None を返す。
+    """
+    key = (url, max_width, max_height)
+    cached_image = memory_cache.get(key)
+    if cached_image is not None:
+        return cached_image
+
     try:
-        response = requests.get(url)
-        response.raise_for_status()  # URLの有効性を確認
-        image = Image.open(BytesIO(response.content))
+        downloaded_headers = None  # 新しく取得したとき、デコードできたら保存する
+        entry = disk_cache.get(url)
+        if entry is not None and entry.fresh:
+            data = entry.data
+        else:
+            # 共有セッション・タイムアウト・サイズ上限付きで取得（エラー時は例外）
+            response = download(url, headers=entry.validators() if entry else None)
+            if response.status_code == 304 and entry is not None:
+                disk_cache.revalidated(url, response.headers)
+                data = entry.data
+            else:
+                data = response.content
+                downloaded_headers = response.headers
+
+        image = Image.open(BytesIO(data))
 
         # 画像の縮小処理
         ratio = min(max_width / image.width, max_height / image.height)
-        new_size = (int(image.width * ratio), int(image.height * ratio))
-        resized_image = image.resize(new_size)
+        new_size = (max(1, int(image.width * ratio)), max(1, int(image.height * ratio)))
+        # JPEG はデコード時点で 1/2〜1/8 に縮小させる（表示サイズ以上は保たれる）
+        image.draft(None, new_size)
+        if image.mode in ("1", "P"):
+            image = image.convert("RGBA")
+        # reduce() で粗く縮めてから LANCZOS で仕上げる
+        resized_image = image.resize(new_size, Image.Resampling.LANCZOS, reducing_gap=3.0)
 
+        if downloaded_headers is not None:
+            disk_cache.put(url, data, downloaded_headers)
+        memory_cache.put(key, resized_image)
         return resized_image
     except requests.exceptions.RequestException as e:
         print(f"Failed to fetch image from {url}: {e}")
         return None
+    except (OSError, Image.DecompressionBombError) as e:
+        # 画像でない応答（ログインページの HTML など）や途中で切れたデータ
+        print(f"Failed to decode image from {url}: {e}")
+        disk_cache.discard(url)
+        return None
+
 
+def extract_post_content(post, max_width=None, max_height=None) -> tuple[str, Optional[str]]:
+    """投稿の本文と画像 URL を取り出す
 
-def extract_post_content(post) -> tuple[str, Optional[str]]:
+    表示枠（*max_width* x *max_height*）が分かっていて、サムネイルで足りる大きさなら
+    fullsize ではなく thumb の URL を返す。
+    """
     post_text = post.record.text
     image_urls: Optional[str] = None
 
     # embedがNoneでなく、py_typeが'app.bsky.embed.images#view'を含んでいる場合
     if post.embed is not None and post.embed.py_type == "app.bsky.embed.images#view":
-        image_urls = post.embed.images[0].fullsize
+        image = post.embed.images[0]
+        image_urls = image.thumb if _thumb_is_enough(image, max_width, max_height) else image.fullsize
 
     return post_text, image_urls
+
+
+#: Bluesky のサムネイル（feed_thumbnail）の長辺の上限
+THUMB_MAX_EDGE = 1000
+
+
+def _thumb_is_enough(image, max_width, max_height) -> bool:
+    """表示枠に縮小したときにサムネイルの画素数で足りるか
+
+    サムネイルは元画像を長辺 THUMB_MAX_EDGE までに縮めたもの（拡大はしない）なので、
+    枠の長辺が THUMB_MAX_EDGE 以下なら、どんな縦横比でも表示サイズ以上の解像度がある。
+    """
+    if not getattr(image, "thumb", None) or max_width is None or max_height is None:
+        return False
+    return max(max_width, max_height) <= THUMB_MAX_EDGE
@@ -0,0 +1,165 @@
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, List, Optional, Sequence, Tuple
+
+from .polling import AdaptiveInterval
+
+#: fetch_page(limit, cursor) -> (フィードの要素, 次のページのカーソル)。失敗したら例外を投げる
+FetchPage = Callable[[int, Optional[str]], Tuple[Sequence[Any], Optional[str]]]
+
+
+class PostBuffer:
+    """取得済みの投稿をためておき、少なくなったときだけ新着分を取得するバッファ
+
+    タイムラインは新しい順に返るので、補充時は先頭から小さいページで読み、
+    前回いちばん新しかった投稿（先頭マーカー）に到達したらそこで止める。
+    マーカーが見つからない間だけカーソルで次のページをたどる。途中のページの
+    取得に失敗したらマーカーは進めず、次の補充で抜けた分を取り直す。
+    新着はキューの先頭に入れるので、たまっている古い投稿より先に表示される。
+    新着がなくキューが空になったら、最近表示した投稿からランダムに返す。
+    補充は min_refill_sec 秒に 1 回まで（まだ何も表示できるものがないときを除く）。
+    refill_interval を渡すと、この間隔を新着のペースに合わせて伸び縮みさせる。
+    """
+
+    def __init__(
+        self,
+        fetch_page: FetchPage,
+        low_water: int = 5,
+        initial_limit: int = 50,
+        page_size: int = 10,
+        max_pages: int = 5,
+        min_refill_sec: float = 120.0,
+        history_size: int = 50,
+        seen_size: int = 500,
+        refill_interval: Optional[AdaptiveInterval] = None,
+    ) -> None:
+        self.fetch_page = fetch_page
+        self.low_water = low_water
+        self.initial_limit = initial_limit
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.min_refill_sec = min_refill_sec
+        self.seen_size = seen_size
+        self.refill_interval = refill_interval
+
+        self.queue: Deque[Any] = deque()
+        self.history: Deque[Any] = deque(maxlen=history_size)
+        self.newest_uri: Optional[str] = None
+        self._last_refill: Optional[float] = None
+        self._last_observed: Optional[float] = None
+        self._unobserved = 0  # 途中で失敗した補充で得た新着数（次に観測するときに足す）
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 統計
+        self.requests = 0
+        self.fetched_items = 0
+
+    def next_post(self) -> Any:
+        """次に表示する投稿を返す（必要なら補充する）。何もなければ None"""
+        with self._lock:
+            if self._wants_refill():
+                self._refill()
+            if self.queue:
+                post = self.queue.popleft()
+                self.history.append(post)
+                return post
+            if self.history:
+                return random.choice(self.history)
+            return None
+
+    def peek(self, count: int) -> List[Any]:
+        """次に表示される予定の投稿を最大 *count* 件返す（取り出さない）"""
+        with self._lock:
+            return list(self.queue)[:count]
+
+    def clear(self) -> None:
+        """アカウント切り替え時などにすべて捨てる"""
+        with self._lock:
+            self.queue.clear()
+            self.history.clear()
+            self._seen.clear()
+            self.newest_uri = None
+            self._last_refill = None
+            self._last_observed = None
+            self._unobserved = 0
+
+    def _wants_refill(self) -> bool:
+        if not self.history:
+            return not self.queue or self._refill_due()
+        if not self._refill_due():
+            return False
+        # 間隔を新着ペースで決めている場合は、キューの残りに関係なく取りに行く
+        return self.refill_interval is not None or len(self.queue) < self.low_water
+
+    def _refill_due(self) -> bool:
+        if self._last_refill is None:
+            return True
+        interval = self.refill_interval.current if self.refill_interval else self.min_refill_sec
+        return time.monotonic() - self._last_refill >= interval
+
+    def _refill(self) -> int:
+        """先頭マーカーより新しい投稿を取得してキューに足し、追加件数を返す"""
+        self._last_refill = time.monotonic()
+        first_fill = self.newest_uri is None
+        limit = self.initial_limit if first_fill else self.page_size
+        new_posts: List[Any] = []
+        newest_uri: Optional[str] = None
+        cursor: Optional[str] = None
+        failed = False
+
+        for _ in range(1 if first_fill else self.max_pages):
+            try:
+                feed, cursor = self.fetch_page(limit, cursor)
+            except Exception:
+                # 報告は fetch_page 側で済んでいる
+                failed = True
+                break
+            self.requests += 1
+            self.fetched_items += len(feed)
+
+            reached_marker = False
+            for item in feed:
+                post = item.post
+                if newest_uri is None:
+                    newest_uri = post.uri
+                if post.uri == self.newest_uri:
+                    reached_marker = True
+                    break
+                if post.uri not in self._seen:
+                    self._remember(post.uri)
+                    new_posts.append(post)
+            if reached_marker or not cursor:
+                break
+
+        if newest_uri is not None and not failed:
+            # マーカーまでたどれなかった補充では、マーカーを進めると間の投稿が二度と
+            # 取得されない。取得済みの分は _seen に入っているので、次回は重複せずに続きを読む
+            if not first_fill:
+                self._observe(self._unobserved + len(new_posts))
+            self._last_observed = self._last_refill
+            self._unobserved = 0
+            self.newest_uri = newest_uri
+        elif not first_fill:
+            self._unobserved += len(new_posts)
+        random.shuffle(new_posts)
+        if first_fill:
+            self.queue.extend(new_posts)
+        else:
+            # 新着を先に出し、あふれたら古いものから捨てる
+            self.queue.extendleft(new_posts)
+            while len(self.queue) > self.initial_limit:
+                self.queue.pop()
+        return len(new_posts)
+
+    def _observe(self, new_items: int) -> None:
+        if self.refill_interval is None or self._last_observed is None:
+            return
+        self.refill_interval.observe(new_items, self._last_refill - self._last_observed)
+
+    def _remember(self, uri: str) -> None:
+        self._seen[uri] = None
+        if len(self._seen) > self.seen_size:
+            self._seen.popitem(last=False)
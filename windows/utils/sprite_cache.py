@@ -0,0 +1,73 @@
+import hashlib
+import os
+import threading
+from io import BytesIO
+from pathlib import Path
+from typing import Tuple, Union
+
+from PIL import Image
+
+from .chroma_key import make_background_fully_transparent
+
+#: 前処理済みスプライトの保存先
+CACHE_DIR = Path("data/sprite_cache")
+#: 前処理の内容を変えたら上げる（古いキャッシュを無効化するため）
+CACHE_VERSION = 1
+
+
+def resize_to_fit(image: Image.Image, max_width: int, max_height: int) -> Image.Image:
+    """縦横比を保ったまま max_width x max_height に収まるようリサイズ"""
+    ratio = min(max_width / image.width, max_height / image.height)
+    return image.resize((int(image.width * ratio), int(image.height * ratio)))
+
+
+def load_sprite(
+    path: Union[str, Path],
+    color: Tuple[int, int, int],
+    tolerance: int,
+    max_width: int,
+    max_height: int,
+) -> Image.Image:
+    """クロマキー + リサイズ済みの RGBA 画像を返す
+
+    キャッシュキーは元画像のハッシュ・キー色・許容値・表示サイズから作るので、
+    どれかが変われば自動的に作り直される。キャッシュがなければその場で加工し、
+    保存はバックグラウンドで行う。
+    """
+    path = Path(path)
+    source = path.read_bytes()
+    cache_file = CACHE_DIR / f"{path.stem}-{_cache_key(source, color, tolerance, max_width, max_height)}.png"
+
+    if cache_file.is_file():
+        try:
+            with Image.open(cache_file) as cached:
+                cached.load()
+                if cached.mode == "RGBA":
+                    return cached.copy()
+        except OSError as e:
+            print(f"Broken sprite cache {cache_file}: {e}")
+
+    image = make_background_fully_transparent(Image.open(BytesIO(source)), color, tolerance)
+    image = resize_to_fit(image, max_width, max_height)
+    threading.Thread(target=_store, args=(cache_file, path.stem, image), daemon=True).start()
+    return image
+
+
+def _cache_key(source: bytes, color: Tuple[int, int, int], tolerance: int, max_width: int, max_height: int) -> str:
+    digest = hashlib.sha256(source)
+    digest.update(f"|v{CACHE_VERSION}|{tuple(color)}|{tolerance}|{max_width}x{max_height}".encode())
+    return digest.hexdigest()[:32]
+
+
+def _store(cache_file: Path, stem: str, image: Image.Image) -> None:
+    """キャッシュを書き出し、同じ元画像の古いエントリを削除する"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_name(f"{cache_file.name}.{threading.get_ident()}.tmp")
+        image.save(tmp, format="PNG")
+        os.replace(tmp, cache_file)
+        for stale in cache_file.parent.glob(f"{stem}-*.png"):
+            if stale != cache_file:
+                stale.unlink(missing_ok=True)
+    except OSError as e:
+        print(f"Failed to write sprite cache {cache_file}: {e}")
@@ -0,0 +1,130 @@
+import importlib.abc
+import importlib.machinery
+import os
+import sys
+import threading
+import time
+from typing import List, Tuple
+
+#: このモジュールが最初に import された時刻（main.py の先頭で import して起動時刻とみなす）
+PROCESS_START = time.perf_counter()
+
+#: 起動時に読み込まれていたら遅延 import が崩れている（リグレッション）とみなすモジュール
+HEAVY_MODULES = ("atproto", "atproto_client", "pydantic", "cryptography", "requests")
+
+#: この環境変数が設定されていれば import ごとの所要時間を記録する
+IMPORTTIME_ENV = "DESKTOP_MASCOT_IMPORTTIME"
+
+
+class StartupTimer:
+    """起動時の各段階までの経過時間を記録し、レポートを作る"""
+
+    def __init__(self, start: float = PROCESS_START) -> None:
+        self.start = start
+        self.marks: List[Tuple[str, float]] = []
+
+    def mark(self, label: str) -> float:
+        """*label* の時点を記録し、起動からの経過秒を返す"""
+        now = time.perf_counter()
+        self.marks.append((label, now))
+        return now - self.start
+
+    def elapsed(self, label: str) -> float | None:
+        for name, t in self.marks:
+            if name == label:
+                return t - self.start
+        return None
+
+    def report(self) -> str:
+        lines = ["startup timing:"]
+        prev = self.start
+        for label, t in sorted(self.marks, key=lambda m: m[1]):
+            lines.append(f"  {(t - self.start) * 1000:8.1f} ms  (+{(t - prev) * 1000:7.1f} ms)  {label}")
+            prev = t
+        heavy = loaded_heavy_modules()
+        lines.append(f"  heavy modules loaded: {', '.join(heavy) if heavy else 'none'}")
+        return "\n".join(lines)
+
+
+def loaded_heavy_modules() -> List[str]:
+    """HEAVY_MODULES のうち、すでに import 済みのもの"""
+    return [name for name in HEAVY_MODULES if name in sys.modules]
+
+
+class ImportTimer(importlib.abc.MetaPathFinder):
+    """``-X importtime`` と同様に、モジュールごとの import 時間を記録する
+
+    sys.meta_path の先頭に入り、見つかったモジュールのローダーの
+    ``exec_module`` を計測用の関数で包む（ローダー自体は差し替えない）。
+    """
+
+    #: モジュールごとにインスタンスが作られるローダーだけを対象にする
+    _PER_MODULE_LOADERS = (
+        importlib.machinery.SourceFileLoader,
+        importlib.machinery.SourcelessFileLoader,
+        importlib.machinery.ExtensionFileLoader,
+    )
+
+    def __init__(self) -> None:
+        # (モジュール名, 自身の秒数, 子を含めた秒数)
+        self.records: List[Tuple[str, float, float]] = []
+        self._local = threading.local()
+
+    def install(self) -> None:
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if isinstance(spec.loader, self._PER_MODULE_LOADERS):
+                self._wrap(spec.loader, fullname)
+            return spec
+        return None
+
+    def _wrap(self, loader, fullname: str) -> None:
+        exec_module = loader.exec_module
+
+        def timed_exec_module(module):
+            stack = self._stack()
+            stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                exec_module(module)
+            finally:
+                elapsed = time.perf_counter() - start
+                children = stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+                self.records.append((fullname, elapsed - children, elapsed))
+
+        loader.exec_module = timed_exec_module
+
+    def _stack(self) -> List[float]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def report(self, limit: int = 20) -> str:
+        lines = [f"import time (top {limit} by cumulative):", "    self [ms] | cumulative [ms] | module"]
+        for name, self_sec, cumulative in sorted(self.records, key=lambda r: r[2], reverse=True)[:limit]:
+            lines.append(f"  {self_sec * 1000:10.1f} | {cumulative * 1000:15.1f} | {name}")
+        return "\n".join(lines)
+
+
+#: IMPORTTIME_ENV が設定されていれば、計測結果（起動時間・保存・検索など）を出力する
+PROFILING = bool(os.environ.get(IMPORTTIME_ENV))
+
+#: PROFILING のときは、このモジュールの import 直後から import 時間を計測する
+IMPORT_TIMER: ImportTimer | None = None
+if PROFILING:
+    IMPORT_TIMER = ImportTimer()
+    IMPORT_TIMER.install()
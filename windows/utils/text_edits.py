@@ -0,0 +1,125 @@
+import tkinter as tk
+from typing import Callable, List, NamedTuple, Tuple
+
+Position = Tuple[int, int]  # (行, 列)。行は 1 始まり、列は 0 始まり（Tk の "行.列" と同じ）
+
+
+class TextEdit(NamedTuple):
+    """tk.Text に対して行われた 1 回の変更
+
+    kind が "insert" なら start に text を挿入した（end は挿入後の末尾）。
+    "delete" なら start から end までの text を削除した（位置はどちらも削除前）。
+    "reset" は中身をまとめて差し替えたなど、個別に追えない変更。
+    """
+
+    kind: str
+    start: Position
+    end: Position
+    text: str
+
+    @property
+    def line_delta(self) -> int:
+        """この変更で増えた行数（削除なら負）"""
+        newlines = self.text.count("\n")
+        return newlines if self.kind == "insert" else -newlines
+
+
+def parse_index(index: str) -> Position:
+    line, col = index.split(".")
+    return int(line), int(col)
+
+
+def end_of(start: Position, text: str) -> Position:
+    """*start* に *text* を置いたときの末尾の位置"""
+    newlines = text.count("\n")
+    if newlines == 0:
+        return start[0], start[1] + len(text)
+    return start[0] + newlines, len(text) - text.rfind("\n") - 1
+
+
+class TextEditTracker:
+    """tk.Text のウィジェットコマンドを差し替えて、挿入・削除をリスナーに通知する
+
+    キー入力・貼り付け・プログラムからの変更のどれも Tcl の
+    ``$w insert`` / ``$w delete`` を通るので、ここで捕まえれば漏れがない。
+    位置は変更前に Tk 自身に正規化させるので、"insert" や "end" などの
+    インデックスも実際の行・列として届く。
+    """
+
+    def __init__(self, text: tk.Text) -> None:
+        self.text = text
+        self._listeners: List[Callable[[TextEdit], None]] = []
+        self._widget = str(text)
+        self._original = f"{self._widget}_original"
+        text.tk.call("rename", self._widget, self._original)
+        text.tk.createcommand(self._widget, self._dispatch)
+        text.bind("<Destroy>", self._on_destroy, add="+")
+
+    def add_listener(self, listener: Callable[[TextEdit], None]) -> None:
+        self._listeners.append(listener)
+
+    def notify_reset(self) -> None:
+        """個別に追えない変更をしたことを知らせる"""
+        self._notify(TextEdit("reset", (1, 0), (1, 0), ""))
+
+    # ------------------------------------------------------------------
+    def _call(self, *args):
+        return self.text.tk.call((self._original,) + args)
+
+    def _index(self, index: str) -> Position:
+        return parse_index(str(self._call("index", index)))
+
+    def _dispatch(self, *args):
+        command = args[0] if args else ""
+        if command == "insert" and len(args) >= 3:
+            return self._insert(args)
+        if command == "delete" and len(args) in (2, 3):
+            return self._delete(args)
+        if command == "replace" and len(args) >= 4:
+            start = "%d.%d" % self._index(args[1])
+            self._delete(("delete", start, args[2]))
+            return self._insert(("insert", start) + tuple(args[3:]))
+
+        result = self._call(*args)
+        if command in ("insert", "delete", "replace"):
+            self.notify_reset()
+        return result
+
+    def _insert(self, args):
+        start = self._index(args[1])
+        if start == self._index("end"):
+            start = self._index("end - 1 chars")  # Tk は最後の改行の手前に入れる
+        result = self._call(*args)
+        text = "".join(args[2::2])
+        if text:
+            self._notify(TextEdit("insert", start, end_of(start, text), text))
+        return result
+
+    def _delete(self, args):
+        start = self._index(args[1])
+        end = self._index(args[2]) if len(args) == 3 else self._index(f"{args[1]} + 1 chars")
+        text_end = self._index("end")
+        if end == text_end:
+            # Tk は最後の改行を消さず、行頭からの削除なら直前の改行を消す
+            end = self._index("end - 1 chars")
+            if start[1] == 0 and start[0] > 1:
+                start = self._index("%d.%d - 1 chars" % start)
+        removed = self._call("get", "%d.%d" % start, "%d.%d" % end) if start < end else ""
+        result = self._call(*args)
+        if removed:
+            self._notify(TextEdit("delete", start, end, removed))
+        return result
+
+    def _notify(self, edit: TextEdit) -> None:
+        for listener in self._listeners:
+            try:
+                listener(edit)
+            except Exception as e:
+                print(f"Text edit listener failed: {e}")
+
+    def _on_destroy(self, event: tk.Event) -> None:
+        if event.widget is self.text:
+            try:
+                self.text.tk.deletecommand(self._widget)
+            except tk.TclError:
+                pass
@@ -0,0 +1,169 @@
+import time
+import tkinter as tk
+from tkinter import font as tkfont
+from typing import Callable, Dict, List, Optional
+
+
+def wrap_text(text: str, font: tkfont.Font, width: int) -> List[str]:
+    """*text* を *width* ピクセルに収まる行に折り返す（レイアウトは 1 回だけ計算する）
+
+    文字幅は 1 文字ずつ measure してキャッシュし、その合計で判定する。
+    半角スペースがあればそこで折り返し、なければ（日本語など）文字の途中で折り返す。
+    """
+    widths: Dict[str, int] = {}
+
+    def char_width(ch: str) -> int:
+        w = widths.get(ch)
+        if w is None:
+            w = widths[ch] = font.measure(ch)
+        return w
+
+    lines: List[str] = []
+    for paragraph in text.split("\n"):
+        line: List[str] = []
+        line_width = 0
+        for ch in paragraph:
+            w = char_width(ch)
+            if line and line_width + w > width:
+                space = "".join(line).rfind(" ")
+                if space > 0:
+                    lines.append("".join(line[:space]))
+                    line = line[space + 1:]
+                else:
+                    lines.append("".join(line))
+                    line = []
+                line_width = sum(char_width(c) for c in line)
+            line.append(ch)
+            line_width += w
+        lines.append("".join(line))
+    return lines
+
+
+class Typewriter:
+    """Canvas のテキストアイテムに文字を少しずつ表示する
+
+    折り返し済みの行ごとにテキストアイテムを作り、書き換えるのは表示途中の
+    行だけにする（全文を毎回レイアウトし直さない）。表示する文字数は経過時間と
+    chars_per_sec から決めるので、1 フレームで複数文字をまとめて出すことがある。
+    1 回の更新が frame_budget_ms を超えたら更新間隔を広げ、Tk スレッドを占有しない。
+    """
+
+    def __init__(
+        self,
+        canvas: tk.Canvas,
+        chars_per_sec: float = 20.0,
+        frame_ms: int = 16,
+        frame_budget_ms: float = 4.0,
+        max_frame_ms: int = 200,
+    ) -> None:
+        self.canvas = canvas
+        self.chars_per_sec = chars_per_sec
+        self.frame_ms = frame_ms
+        self.frame_budget_ms = frame_budget_ms
+        self.max_frame_ms = max_frame_ms
+
+        self._lines: List[str] = []
+        self._items: Dict[int, int] = {}  # 行番号 -> テキストアイテム
+        self._options: dict = {}
+        self._x = 0
+        self._y = 0
+        self._line_height = 0
+        self._total = 0
+        self._shown = 0
+        self._started = 0.0
+        self._interval = frame_ms
+        self._after_id: Optional[str] = None
+        self._on_done: Optional[Callable[[], None]] = None
+
+        # 統計（直近のアニメーション）
+        self.frames = 0
+
+    @property
+    def running(self) -> bool:
+        return self._after_id is not None
+
+    def start(
+        self,
+        lines: List[str],
+        x: int,
+        y: int,
+        line_height: int,
+        on_done: Optional[Callable[[], None]] = None,
+        **options,
+    ) -> None:
+        """折り返し済みの *lines* を (x, y) から表示し始める。*options* は create_text に渡す"""
+        self.cancel()
+        self._lines = lines
+        self._items = {}
+        self._options = options
+        self._x, self._y = x, y
+        self._line_height = line_height
+        self._total = sum(len(line) for line in lines)
+        self._shown = 0
+        self._started = time.perf_counter()
+        self._interval = max(self.frame_ms, int(1000 / self.chars_per_sec)) if self.chars_per_sec > 0 else 0
+        self._on_done = on_done
+        self.frames = 0
+        if self.chars_per_sec <= 0:
+            self.skip()
+            return
+        self._after_id = self.canvas.after(self._interval, self._tick)
+
+    def skip(self) -> None:
+        """残りを一度に表示して終了する"""
+        if self._after_id is not None:
+            self.canvas.after_cancel(self._after_id)
+            self._after_id = None
+        self._reveal(self._total)
+        self._finish()
+
+    def cancel(self) -> None:
+        """途中で止める（完了コールバックは呼ばない）"""
+        if self._after_id is not None:
+            self.canvas.after_cancel(self._after_id)
+            self._after_id = None
+        self._on_done = None
+
+    def _tick(self) -> None:
+        self._after_id = None
+        target = min(self._total, int((time.perf_counter() - self._started) * self.chars_per_sec) + 1)
+        began = time.perf_counter()
+        self._reveal(target)
+        cost_ms = (time.perf_counter() - began) * 1000
+        self.frames += 1
+
+        if self._shown >= self._total:
+            self._finish()
+            return
+        if cost_ms > self.frame_budget_ms:
+            self._interval = min(self.max_frame_ms, self._interval * 2)
+        self._after_id = self.canvas.after(self._interval, self._tick)
+
+    def _reveal(self, count: int) -> None:
+        """先頭から *count* 文字が見えている状態にする"""
+        if count <= self._shown:
+            return
+        offset = 0
+        for index, line in enumerate(self._lines):
+            end = offset + len(line)
+            if line and end > self._shown and offset < count:
+                visible = line[: count - offset]
+                if index in self._items:
+                    self.canvas.itemconfigure(self._items[index], text=visible)
+                else:
+                    self._items[index] = self.canvas.create_text(
+                        self._x,
+                        self._y + index * self._line_height,
+                        text=visible,
+                        anchor="nw",
+                        **self._options,
+                    )
+            if end >= count:
+                break
+            offset = end
+        self._shown = count
+
+    def _finish(self) -> None:
+        on_done, self._on_done = self._on_done, None
+        if on_done is not None:
+            on_done()
@@ -0,0 +1,61 @@
+import tkinter as tk
+from collections import defaultdict
+from typing import Callable, Dict, List, Tuple
+
+
+def count_widgets(widget: tk.Misc) -> int:
+    """*widget* 以下にある Tk ウィジェットの数（自分自身を含む）"""
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+class WidgetPool:
+    """Canvas に埋め込むウィジェットを種類ごとに作り置きして使い回す
+
+    画面を切り替えるたびにウィジェットを作ると、``canvas.delete`` では
+    埋め込みアイテムが消えるだけでウィジェット本体は残り続ける。
+    このプールは種類ごとに必要な数だけ作り、画面を消すとき ``release_all`` で
+    空きに戻して次の画面で設定し直して使う。イベントのバインドは作成時に
+    1 回だけ行うこと（コールバックは ``event.widget`` から対象を判断する）。
+    """
+
+    def __init__(self, canvas: tk.Canvas, factories: Dict[str, Callable[[tk.Misc], tk.Widget]]) -> None:
+        self.canvas = canvas
+        self._factories = factories
+        self._idle: Dict[str, List[tk.Widget]] = defaultdict(list)
+        self._in_use: List[Tuple[str, tk.Widget]] = []
+
+        # 統計
+        self.created = 0
+        self.reused = 0
+
+    def place(self, kind: str, x: int, y: int, window_anchor: str = "nw", **options) -> tk.Widget:
+        """*kind* のウィジェットを *options* で設定し、Canvas の (x, y) に置く
+
+        *window_anchor* は Canvas 上の置き方。ウィジェット自身の anchor などは *options* で渡す。
+        """
+        idle = self._idle[kind]
+        if idle:
+            widget = idle.pop()
+            self.reused += 1
+        else:
+            widget = self._factories[kind](self.canvas)
+            self.created += 1
+        if options:
+            widget.configure(**options)
+        self.canvas.create_window(x, y, anchor=window_anchor, window=widget, tags="pooled")
+        self._in_use.append((kind, widget))
+        return widget
+
+    def release_all(self) -> None:
+        """Canvas から外して、すべて空きに戻す"""
+        self.canvas.delete("pooled")
+        for kind, widget in self._in_use:
+            self._idle[kind].append(widget)
+        self._in_use.clear()
+
+    def report(self) -> str:
+        idle = sum(len(widgets) for widgets in self._idle.values())
+        return (
+            f"created={self.created} reused={self.reused} in_use={len(self._in_use)} idle={idle} "
+            f"tk_widgets={count_widgets(self.canvas.winfo_toplevel())}"
+        )